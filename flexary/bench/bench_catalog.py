@@ -0,0 +1,201 @@
+"""Scaling benchmark for the catalog pipeline under plain CPython.
+
+Generates synthetic catalogs (CSV + snapshot) and custom-exercise JSON blobs,
+then times every stage the browser runs on boot and on each keystroke:
+
+    normalize   exercise_records.normalize_exercise_records on the raw rows
+    load csv    catalog._load_base_exercises with no usable snapshot
+    load snap   catalog._load_base_exercises from a matching snapshot
+    customs     catalog.parse_custom_exercises + catalog.refresh (10% customs)
+    upsert      catalog.upsert_custom + catalog.remove_custom of one exercise
+    search      catalog.search over SEARCHES (prefix, multi-token, fuzzy)
+    filter      filters._query (cold cache) over QUERIES plus badge HTML
+
+The browser modules are imported with `js`, `pyscript`, `pyodide` and `pyweb`
+replaced by inert stubs, so only the Python side is measured.  Results are
+printed as a table and written as JSON; pass a previous JSON file with
+--compare to print the ratio against it.
+
+    python bench/bench_catalog.py                       # 1k / 10k / 100k
+    python bench/bench_catalog.py 2000 20000 --json out.json --compare base.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(ROOT / "src" / "py"))
+
+from bench_facets import QUERIES, synthetic_records  # noqa: E402
+
+SEARCHES = ["squat", "press row", "quadri", "lattisimus", "hold 12"]
+STAGES = ["normalize", "load csv", "load snap", "customs", "upsert", "search", "filter"]
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_JSON = ROOT / "bench" / "results" / "bench_catalog.json"
+
+
+def _stub_module(name: str, **attrs) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    module.__getattr__ = lambda attr: mock.MagicMock(name=f"{name}.{attr}")
+    return module
+
+
+def install_browser_stubs() -> None:
+    """Make the browser-only imports resolvable; every missing name is a MagicMock."""
+    local_storage = mock.MagicMock(name="localStorage")
+    local_storage.getItem.return_value = None
+    window = mock.MagicMock(name="window")
+    window.navigator.language = "en"
+    identity = lambda value, *args, **kwargs: value  # noqa: E731
+    pyodide = _stub_module("pyodide")
+    pyodide.__path__ = []
+    sys.modules.update({
+        "js": _stub_module("js", localStorage=local_storage, window=window),
+        "pyodide": pyodide,
+        "pyodide.ffi": _stub_module("pyodide.ffi", create_proxy=identity, create_once_callable=identity, to_js=identity),
+        "pyodide.ffi.wrappers": _stub_module("pyodide.ffi.wrappers"),
+        "pyodide.http": _stub_module("pyodide.http"),
+        "pyscript": _stub_module("pyscript", window=window, when=lambda *args, **kwargs: identity),
+        "pyweb": _stub_module("pyweb"),
+    })
+
+
+def synthetic_catalog(count: int) -> list[dict]:
+    records = synthetic_records(count)
+    for i, record in enumerate(records):
+        record["equipment"] = ["Barbell", "Dumbbell", "Kettlebell", "Bodyweight"][i % 4]
+        record["key_cues"] = "Brace core, Drive through heels, Keep neck neutral"
+        record["instructions"] = "Set up with feet hip-width apart and move under control. " * 4
+        record["alternatives"] = f"{(i + 7) % count + 1},{(i + 13) % count + 1}"
+    return records
+
+
+def _write_csv(path: Path, records: list[dict]) -> None:
+    import csv
+
+    fields = list(records[0])
+    with path.open("w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of fn() over repeat runs, in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started_at)
+    return best * 1000
+
+
+def run(size: int, repeat: int) -> dict[str, float]:
+    import catalog
+    import filters
+    import state
+    from exercise_records import normalize_exercise_records
+
+    raw = synthetic_catalog(size)
+    customs = [
+        {**record, "id": str(-(i + 1)), "name": f"Custom {record['name']}"}
+        for i, record in enumerate(synthetic_catalog(max(1, size // 10)))
+    ]
+    custom_blob = json.dumps(customs)
+    results: dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "exercises.csv"
+        snapshot_path = Path(tmp) / "exercises_snapshot.json"
+        _write_csv(csv_path, raw)
+
+        results["normalize"] = _timed(lambda: normalize_exercise_records(raw, is_custom=False), repeat)
+        results["load csv"] = _timed(lambda: catalog._load_base_exercises(str(csv_path), str(snapshot_path)), repeat)
+        snapshot_path.write_text(json.dumps(catalog.build_snapshot(csv_path)), encoding="utf-8")
+        results["load snap"] = _timed(lambda: catalog._load_base_exercises(str(csv_path), str(snapshot_path)), repeat)
+        catalog._base_exercises, catalog._base_facet_positions = catalog._load_base_exercises(
+            str(csv_path), str(snapshot_path)
+        )
+
+    results["customs"] = _timed(lambda: catalog.refresh(catalog.parse_custom_exercises(custom_blob)), repeat)
+    edited = {**customs[0], "name": "Zz Edited", "body_parts": "Neck"}
+
+    def upsert_and_remove() -> None:
+        catalog.upsert_custom(edited)
+        catalog.remove_custom(edited["id"])
+
+    results["upsert"] = _timed(upsert_and_remove, repeat)
+    results["search"] = _timed(lambda: [catalog.search(query) for query in SEARCHES], repeat) / len(SEARCHES)
+
+    def filter_queries() -> None:
+        for search_str, categories, body_parts, muscles in QUERIES:
+            state.active_category_filters = set(categories)
+            state.active_body_part_filters = set(body_parts)
+            state.active_primary_muscle_filters = set(muscles)
+            filters._query_cache.clear()
+            _display, result, _total = filters._query(search_str)
+            filters.build_category_badges(result.counts["category"])
+            filters.build_body_part_badges(result.counts["body_parts"])
+            filters.build_primary_muscle_badges(result.counts["primary_muscles"])
+
+    results["filter"] = _timed(filter_queries, repeat) / len(QUERIES)
+    return results
+
+
+def print_table(results: dict[str, dict[str, float]], baseline: dict | None) -> None:
+    print(f"{'ms':>10}" + "".join(f"  {size:>14}" for size in results))
+    for stage in STAGES:
+        row = f"{stage:>10}"
+        for size, timings in results.items():
+            cell = f"{timings[stage]:.2f}"
+            old = (baseline or {}).get(size, {}).get(stage)
+            if old:
+                cell += f" {timings[stage] / old:.2f}x"
+            row += f"  {cell:>14}"
+        print(row)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, default=DEFAULT_JSON, help="where to write the results")
+    parser.add_argument("--compare", type=Path, help="previous results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    install_browser_stubs()
+    results = {str(size): run(size, args.repeat) for size in args.sizes}
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"] if args.compare else None
+    print_table(results, baseline)
+
+    args.json.parent.mkdir(parents=True, exist_ok=True)
+    args.json.write_text(
+        json.dumps(
+            {
+                "benchmark": "bench_catalog",
+                "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "unit": "ms",
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,139 @@
+"""CPython micro-benchmark for the facet engine used by filters.update().
+
+Compares the bitset engine (catalog facet index + facets.compute) against the
+previous list-comprehension implementation on synthetic catalogs, and checks
+that both produce identical display ids and badge counts.
+
+    python bench/bench_facets.py            # 1k / 10k / 50k records
+    python bench/bench_facets.py 2000 5000  # custom sizes
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "py"))
+
+import catalog  # noqa: E402
+import facets  # noqa: E402
+from exercise_records import compact_exercise_records, normalize_exercise_records  # noqa: E402
+
+CATEGORIES = ["Strength", "Conditioning", "Mobility", "Stretching"]
+BODY_PARTS = ["Arms", "Back", "Chest", "Core", "Shoulders", "Upper Legs", "Lower Legs", "Full Body", "Hips", "Neck"]
+MUSCLES = [
+    "Quadriceps", "Hamstrings", "Gluteus Maximus", "Latissimus Dorsi", "Biceps Brachii", "Triceps Brachii",
+    "Deltoids", "Pectoralis Major", "Rhomboids", "Trapezius", "Calves", "Erector Spinae", "Obliques",
+    "Rectus Abdominis", "Adductors", "Hip Flexors", "Forearms", "Rotator Cuff",
+]
+WORDS = ["Squat", "Press", "Row", "Curl", "Lunge", "Plank", "Swing", "Raise", "Stretch", "Hold", "Pull", "Carry"]
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+
+QUERIES = [
+    ("", set(), set(), set()),
+    ("squat", set(), set(), set()),
+    ("", {"Strength"}, set(), set()),
+    ("", {"Strength", "Mobility"}, {"Back", "Core"}, set()),
+    ("press", {"Strength"}, {"Chest"}, {"Triceps Brachii", "Deltoids"}),
+]
+
+
+def synthetic_records(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(i + 1),
+            "name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+            "category": ",".join(rng.sample(CATEGORIES, rng.randint(1, 2))),
+            "body_parts": ",".join(rng.sample(BODY_PARTS, rng.randint(1, 3))),
+            "primary_muscles": ",".join(rng.sample(MUSCLES, rng.randint(1, 4))),
+            "secondary_muscles": ",".join(rng.sample(MUSCLES, rng.randint(0, 4))),
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_update(exercises, search_str, categories, body_parts, muscles):
+    """The filters.update() logic before the facet index, minus the DOM work."""
+    search_str = search_str.strip().lower()
+    search_filtered = [
+        ex for ex in exercises
+        if search_str in ex["name"].lower()
+        or search_str in ex["category"].lower()
+        or search_str in ex["body_parts"].lower()
+    ]
+
+    def passes(ex, field, active):
+        return not active or any(v.strip() in active for v in ex[field].split(","))
+
+    def count(records, field):
+        counts: dict = {}
+        for ex in records:
+            for value in ex[field].split(","):
+                value = value.strip()
+                if value:
+                    counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    display = [
+        ex for ex in search_filtered
+        if passes(ex, "category", categories) and passes(ex, "body_parts", body_parts)
+        and passes(ex, "primary_muscles", muscles)
+    ]
+    cat_counts = count([
+        ex for ex in search_filtered
+        if passes(ex, "body_parts", body_parts) and passes(ex, "primary_muscles", muscles)
+    ], "category")
+    bp_counts = count([
+        ex for ex in search_filtered
+        if passes(ex, "category", categories) and passes(ex, "primary_muscles", muscles)
+    ], "body_parts")
+    pm_counts = count([
+        ex for ex in search_filtered
+        if passes(ex, "category", categories) and passes(ex, "body_parts", body_parts)
+    ], "primary_muscles")
+    return [ex["id"] for ex in display], {"category": cat_counts, "body_parts": bp_counts, "primary_muscles": pm_counts}
+
+
+def engine_update(search_str, categories, body_parts, muscles):
+    selections = {"category": categories, "body_parts": body_parts, "primary_muscles": muscles}
+    result = facets.compute(
+        catalog.search_mask(search_str),
+        catalog.facet_indexes(),
+        {field: catalog.selection_mask(field, values) for field, values in selections.items()},
+    )
+    return [ex["id"] for ex in catalog.exercises_in(result.display_mask)], result.counts
+
+
+def run(size: int, repeat: int = 5) -> tuple[float, float]:
+    catalog._base_exercises = sorted(
+        compact_exercise_records(normalize_exercise_records(synthetic_records(size), is_custom=False)),
+        key=lambda ex: ex["name"],
+    )
+    catalog._base_facet_positions = catalog._facet_positions(catalog._base_exercises)
+    catalog.refresh([])
+    exercises = catalog.all_exercises()
+
+    for query in QUERIES:
+        assert legacy_update(exercises, *query) == engine_update(*query), f"mismatch for {query!r}"
+
+    legacy = min(timeit.repeat(lambda: [legacy_update(exercises, *q) for q in QUERIES], number=1, repeat=repeat))
+    engine = min(timeit.repeat(lambda: [engine_update(*q) for q in QUERIES], number=1, repeat=repeat))
+    return legacy / len(QUERIES), engine / len(QUERIES)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'records':>8}  {'legacy ms':>10}  {'engine ms':>10}  {'speedup':>8}")
+    for size in args.sizes:
+        legacy, engine = run(size, args.repeat)
+        print(f"{size:>8}  {legacy * 1000:>10.2f}  {engine * 1000:>10.2f}  {legacy / engine:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
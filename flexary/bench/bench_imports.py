@@ -0,0 +1,89 @@
+"""Import cost of main.py's boot path with and without the workout stack.
+
+Each measurement imports a set of app modules in a fresh CPython process, with
+the browser modules stubbed as in bench_catalog, and reports the best of
+--repeat runs.  "eager" is what main.py used to import up front; "boot" is
+what it imports now, with the workout stack left to _lazy().  Pyodide runs
+slower than CPython, but the ratio carries over.
+
+With --bundle, the boot modules are instead imported the way a fresh Pyodide
+page does: compiled from source (no __pycache__), or from the archive built by
+scripts/build_bundle.py.
+
+    python bench/bench_imports.py
+    python bench/bench_imports.py --bundle dist/flexary_bundle.zip
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src" / "py"
+
+BOOT_MODULES = ["catalog", "state", "i18n", "common", "auth", "filters", "exercise_grid"]
+WORKOUT_STACK = ["workouts", "ics", "workout_export", "custom_exercises"]
+
+_SCRIPT = """
+import sys, tempfile, time
+sys.path.insert(0, {bench!r})
+import bench_catalog
+bench_catalog.install_browser_stubs()
+for name in {app!r}:
+    sys.modules.pop(name, None)
+{prelude}
+started_at = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+print((time.perf_counter() - started_at) * 1000)
+print(len([m for m in sys.modules if m in {app!r}]))
+"""
+
+
+# Force every module to be compiled from source, as on a fresh page load.
+_FROM_SOURCE = """
+sys.dont_write_bytecode = True
+sys.pycache_prefix = tempfile.mkdtemp()
+"""
+_FROM_ARCHIVE = """
+sys.path.remove({src!r})
+sys.path.insert(0, {archive!r})
+"""
+
+
+def measure(modules: list[str], repeat: int, prelude: str = "") -> tuple[float, int]:
+    app = [path.stem for path in SRC_DIR.glob("*.py")]
+    script = _SCRIPT.format(bench=str(BENCH_DIR), modules=modules, app=app, prelude=prelude)
+    best, loaded = float("inf"), 0
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+        elapsed, count = output.split()
+        best, loaded = min(best, float(elapsed)), int(count)
+    return best, loaded
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--bundle", type=Path, help="archive built by scripts/build_bundle.py")
+    args = parser.parse_args(argv)
+
+    if args.bundle:
+        source_ms, count = measure(BOOT_MODULES, args.repeat, _FROM_SOURCE)
+        archive_ms, _count = measure(
+            BOOT_MODULES, args.repeat, _FROM_ARCHIVE.format(src=str(SRC_DIR), archive=str(args.bundle.resolve()))
+        )
+        print(f"{count} boot modules: {source_ms:.1f} ms compiled from source, {archive_ms:.1f} ms from {args.bundle.name}")
+        return
+
+    eager_ms, eager_count = measure(BOOT_MODULES + WORKOUT_STACK, args.repeat)
+    boot_ms, boot_count = measure(BOOT_MODULES, args.repeat)
+    print(f"{'':>6}  {'import ms':>10}  {'app modules':>11}")
+    print(f"{'eager':>6}  {eager_ms:>10.1f}  {eager_count:>11}")
+    print(f"{'boot':>6}  {boot_ms:>10.1f}  {boot_count:>11}")
+    print(f"deferred {eager_count - boot_count} modules, {100 * (1 - boot_ms / eager_ms):.0f}% less import time on boot")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
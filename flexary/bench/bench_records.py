@@ -0,0 +1,86 @@
+"""Compare plain ExerciseRecord dicts with CompactExerciseRecord under CPython.
+
+Reports resident size (tracemalloc) of a synthetic catalog held both ways and
+the time to read every comma-list field of every record, splitting the joined
+string as callers did before versus reading the pre-split tuple.
+
+The memory saving grows with the catalog: list-field values are interned, so
+repeated muscles, body parts and cues are stored once however many records
+share them.  The default sizes show both ends of that.
+
+    python bench/bench_records.py          # 2k and 10k records
+    python bench/bench_records.py 50000
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "py"))
+
+from bench_facets import synthetic_records  # noqa: E402
+from exercise_records import LIST_FIELDS, compact_exercise_records, normalize_exercise_records  # noqa: E402
+
+DEFAULT_SIZES = [2_000, 10_000]
+
+
+def _measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    value = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def split_dicts(records) -> int:
+    total = 0
+    for record in records:
+        for field in LIST_FIELDS:
+            total += len([item.strip() for item in record[field].split(",") if item.strip()])
+    return total
+
+
+def split_compact(records) -> int:
+    total = 0
+    for record in records:
+        for field in LIST_FIELDS:
+            total += len(record.split(field))
+    return total
+
+
+def run(size: int, repeat: int) -> None:
+    raw = synthetic_records(size)
+    for i, record in enumerate(raw):
+        record["key_cues"] = "Keep core tight, Elbows down and back, Avoid swinging"
+        record["alternatives"] = f"{i % 97},{i % 89}"
+
+    dicts, dict_bytes = _measure(lambda: normalize_exercise_records(raw, is_custom=False))
+    compact, compact_bytes = _measure(lambda: compact_exercise_records(normalize_exercise_records(raw, is_custom=False)))
+    assert [dict(record) for record in compact] == dicts
+    assert split_dicts(dicts) == split_compact(compact)
+
+    dict_split = min(timeit.repeat(lambda: split_dicts(dicts), number=1, repeat=repeat))
+    compact_split = min(timeit.repeat(lambda: split_compact(compact), number=1, repeat=repeat))
+
+    print(f"{size} records")
+    print(f"{'':>10}  {'memory KiB':>11}  {'per record B':>12}  {'list fields ms':>14}")
+    print(f"{'dict':>10}  {dict_bytes / 1024:>11.0f}  {dict_bytes / size:>12.0f}  {dict_split * 1000:>14.2f}")
+    print(f"{'compact':>10}  {compact_bytes / 1024:>11.0f}  {compact_bytes / size:>12.0f}  {compact_split * 1000:>14.2f}")
+    print(f"saving {100 * (1 - compact_bytes / dict_bytes):.0f}% memory, {dict_split / compact_split:.1f}x faster list-field reads")
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -15,7 +15,7 @@ export default defineConfig({
     launchOptions: {slowMo: 500},
   },
   webServer: {
-    command: 'python3 -m http.server 4173',
+    command: 'python3 scripts/build_catalog_snapshot.py --check && python3 scripts/build_sw_manifest.py --check && python3 -m http.server 4173',
     url: 'http://127.0.0.1:4173/index.html',
     reuseExistingServer: true,
     timeout: 30_000,
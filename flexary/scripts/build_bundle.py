@@ -0,0 +1,158 @@
+"""Build dist/, a copy of the site whose pages boot from one precompiled archive.
+
+With the source config, every module and data file listed under [files] in
+pyscript.toml is a separate fetch, and each module is compiled from source on
+every load.  The bundle packs them into one archive instead:
+
+    <module>.pyc   precompiled (unchecked-hash pyc, so no mtime checks)
+    <module>.py    source, used by zipimport if the pyc's magic does not match
+    <data file>    the non-locale data files, extracted by bundle.mount()
+
+pyscript.bundle.toml fetches only the archive and src/py/bundle.py.  Locales
+are left out and i18n fetches the active one on demand.
+
+The tracked files are never modified: the site (SITE) is copied into dist/,
+the archive and config are written next to it, and only the copies of the
+pages are pointed at pyscript.bundle.toml.  dist/ then gets its own
+sw-manifest.json and sw.js VERSION (build_sw_manifest.py), since its files
+differ from the tracked ones.  Serve or deploy dist/ to use it; the
+repository root keeps serving the source config.
+
+    python scripts/build_bundle.py
+
+The .pyc files are only used when this script runs on the same Python minor
+version as the browser's Pyodide (TARGET_PYTHON).
+"""
+
+import py_compile
+import re
+import shutil
+import sys
+import tempfile
+import tomllib
+import zipfile
+from pathlib import Path
+
+import build_sw_manifest
+
+ROOT = Path(__file__).resolve().parents[1]
+SOURCE_CONFIG = ROOT / "pyscript.toml"
+OUT = ROOT / "dist"
+BUNDLE_CONFIG = OUT / "pyscript.bundle.toml"
+ARCHIVE = OUT / "flexary_bundle.zip"
+PAGES = ("index.html", "detail.html")
+# What is served, relative to ROOT; copied into OUT as is.
+SITE = (
+    "index.html",
+    "detail.html",
+    "account.html",
+    "workout.html",
+    "CNAME",
+    "sw.js",
+    "pyscript.toml",
+    "pyscript-account.toml",
+    "assets",
+    "data",
+    "locales",
+    "src",
+)
+
+# Pyodide 0.24 (PyScript 2024.1.1) runs CPython 3.11.
+TARGET_PYTHON = (3, 11)
+# Fetched on its own: it is what mounts the archive.
+LOADER = ("./src/py/bundle.py", "bundle.py")
+
+
+def _is_locale(source: str) -> bool:
+    return source.startswith("./locales/")
+
+
+def build_archive(files: dict[str, str]) -> int:
+    """Write ARCHIVE from the [files] table; return the number of entries bundled."""
+    ARCHIVE.parent.mkdir(parents=True, exist_ok=True)
+    bundled = 0
+    with tempfile.TemporaryDirectory() as tmp, zipfile.ZipFile(ARCHIVE, "w", zipfile.ZIP_DEFLATED) as archive:
+        for source, target in files.items():
+            if (source, target) == LOADER or _is_locale(source):
+                continue
+            path = ROOT / source
+            archive.write(path, target)
+            if target.endswith(".py"):
+                pyc = Path(tmp) / f"{target}c"
+                py_compile.compile(
+                    str(path),
+                    cfile=str(pyc),
+                    dfile=target,
+                    doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+                )
+                archive.write(pyc, f"{target}c")
+            bundled += 1
+    return bundled
+
+
+def write_bundle_config(config: dict) -> None:
+    lines = [
+        "# Generated by scripts/build_bundle.py from pyscript.toml; do not edit.",
+        f'name = "{config["name"]}"',
+        f'description = "{config["description"]}"',
+        "",
+        "[files]",
+        f'"./{ARCHIVE.name}" = "{ARCHIVE.name}"',
+        f'"{LOADER[0]}" = "{LOADER[1]}"',
+    ]
+    BUNDLE_CONFIG.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def copy_site() -> None:
+    if OUT.exists():
+        shutil.rmtree(OUT)
+    OUT.mkdir()
+    for name in SITE:
+        path = ROOT / name
+        if path.is_dir():
+            shutil.copytree(path, OUT / name, ignore=shutil.ignore_patterns("__pycache__"))
+        elif path.exists():
+            shutil.copy2(path, OUT / name)
+
+
+def point_pages_at_bundle() -> None:
+    for page in PAGES:
+        path = OUT / page
+        html, count = re.subn(
+            r'(<script type="py" [^>]*config=")\./pyscript\.toml(")',
+            rf"\g<1>./{BUNDLE_CONFIG.name}\g<2>",
+            path.read_text(encoding="utf-8"),
+        )
+        if count != 1:
+            raise SystemExit(f"{page}: no <script type=\"py\"> using pyscript.toml")
+        path.write_text(html, encoding="utf-8")
+
+
+def main() -> None:
+    config = tomllib.loads(SOURCE_CONFIG.read_text(encoding="utf-8"))
+    files: dict[str, str] = config["files"]
+
+    copy_site()
+    bundled = build_archive(files)
+    write_bundle_config(config)
+    point_pages_at_bundle()
+    build_sw_manifest.write(OUT)
+
+    if sys.version_info[:2] != TARGET_PYTHON:
+        print(
+            f"warning: built with Python {sys.version_info.major}.{sys.version_info.minor}, "
+            f"Pyodide runs {TARGET_PYTHON[0]}.{TARGET_PYTHON[1]}: the .pyc files will be ignored",
+            file=sys.stderr,
+        )
+    source_bytes = sum((ROOT / source).stat().st_size for source in files)
+    locale_bytes = max((ROOT / source).stat().st_size for source in files if _is_locale(source))
+    bundle_bytes = ARCHIVE.stat().st_size + (ROOT / LOADER[0]).stat().st_size + locale_bytes
+    print(f"wrote {ARCHIVE.relative_to(ROOT)}: {bundled} files, {ARCHIVE.stat().st_size / 1024:.1f} KiB")
+    print(f"fetches on boot: {len(files)} with pyscript.toml, 3 with {BUNDLE_CONFIG.name} (archive, loader, locale)")
+    print(f"bytes on boot:   {source_bytes / 1024:.1f} KiB -> {bundle_bytes / 1024:.1f} KiB")
+    print(f"serve {OUT.relative_to(ROOT)}/ to boot from the bundle; the tracked pages still use {SOURCE_CONFIG.name}")
+
+
+if __name__ == "__main__":
+    main()
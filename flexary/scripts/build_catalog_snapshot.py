@@ -0,0 +1,72 @@
+"""Build data/exercises_snapshot.json and data/exercise_details.json from data/exercises_library.csv.
+
+Run after every edit to the CSV:
+
+    python scripts/build_catalog_snapshot.py
+
+The browser only downloads the snapshot and trusts it without hashing the
+CSV, so freshness is checked here instead.  --check exits non-zero when
+either file was built from a different CSV; build_sw_manifest.py runs it,
+and the Playwright suite (tests/app.spec.ts) makes the same comparison:
+
+    python scripts/build_catalog_snapshot.py --check
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "py"))
+
+import catalog  # noqa: E402
+
+CSV_PATH = ROOT / "data" / "exercises_library.csv"
+SNAPSHOT_PATH = ROOT / "data" / "exercises_snapshot.json"
+DETAILS_PATH = ROOT / "data" / "exercise_details.json"
+
+
+def _write(path: Path, payload: dict) -> None:
+    path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def stale_files() -> list[Path]:
+    """The snapshot and details files that are missing or were not built from the current CSV."""
+    csv_hash = catalog.source_hash(CSV_PATH)
+    stale = []
+    for path, version in ((SNAPSHOT_PATH, catalog.SNAPSHOT_VERSION), (DETAILS_PATH, catalog.DETAILS_VERSION)):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != version
+            or payload.get("source_sha256") != csv_hash
+        ):
+            stale.append(path)
+    return stale
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check that the files match the CSV")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_files()
+        for path in stale:
+            print(f"{path.relative_to(ROOT)} is stale: run scripts/build_catalog_snapshot.py", file=sys.stderr)
+        raise SystemExit(1 if stale else 0)
+
+    snapshot = catalog.build_snapshot(CSV_PATH)
+    _write(SNAPSHOT_PATH, snapshot)
+    print(f"wrote {SNAPSHOT_PATH.relative_to(ROOT)}: {len(snapshot['rows'])} exercises")
+    details = catalog.build_details(CSV_PATH)
+    _write(DETAILS_PATH, details)
+    print(f"wrote {DETAILS_PATH.relative_to(ROOT)}: {len(details['details'])} exercises")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,154 @@
+"""Build sw-manifest.json and stamp its version into sw.js.
+
+The site is served straight from the repository, so both are committed.  Run
+this as the last step before committing, after build_catalog_snapshot.py, so
+the hashes cover what is served:
+
+    python scripts/build_sw_manifest.py
+
+--check writes nothing and exits non-zero when the committed manifest or the
+VERSION in sw.js no longer match the files; the Playwright suite runs it
+before serving.  build_bundle.py rebuilds both for dist/ with --root dist.
+
+The manifest lists every app file the service worker precaches with the
+sha256 of its content.  Its version is a hash over all of them, so it changes
+exactly when some file does; stamping it into sw.js makes the browser pick up
+the new worker, which then downloads only the files whose hash changed.
+It refuses to run while the catalog snapshot is stale, since the browser
+trusts the snapshot without checking it against the CSV.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from build_catalog_snapshot import stale_files  # noqa: E402
+
+MANIFEST = "sw-manifest.json"
+SERVICE_WORKER = "sw.js"
+VERSION_LINE = re.compile(r'^const VERSION = "([^"]*)";', re.M)
+
+PRECACHE = [
+    "index.html",
+    "detail.html",
+    "account.html",
+    "workout.html",
+    "pyscript.toml",
+    "pyscript-account.toml",
+    "pyscript.bundle.toml",
+    "flexary_bundle.zip",
+    "src/py/*.py",
+    "src/js/*.js",
+    # The CSV is left out: it is only fetched when the snapshot is unusable.
+    "data/*.json",
+    "locales/*.json",
+    "assets/css/*.css",
+    "assets/fonts/*",
+    "assets/exercises/*",
+    "assets/flags/*",
+    "assets/favicon.jpeg",
+    "assets/logo-nobg.webp",
+]
+
+# Fetched into the runtime cache on install, best effort.  Everything else
+# under sw.js's RUNTIME_PREFIXES (PyScript chunks, Pyodide packages, wheels)
+# is cached on first use.
+RUNTIME_PRECACHE = [
+    "https://pyscript.net/releases/2024.1.1/core.js",
+    "https://pyscript.net/releases/2024.1.1/core.css",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide.mjs",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide.js",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide.asm.js",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide.asm.wasm",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/python_stdlib.zip",
+    "https://cdn.jsdelivr.net/pyodide/v0.24.1/full/pyodide-lock.json",
+    "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.css",
+]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def precache_files(root: Path) -> dict[str, str]:
+    files = {}
+    for pattern in PRECACHE:
+        for path in sorted(root.glob(pattern)):
+            if path.is_file():
+                files[f"./{path.relative_to(root).as_posix()}"] = _sha256(path.read_bytes())
+    return files
+
+
+def build_manifest(root: Path) -> dict:
+    files = precache_files(root)
+    runtime = {"precache": RUNTIME_PRECACHE}
+    runtime["version"] = _sha256(json.dumps(runtime, sort_keys=True).encode())[:12]
+    version = _sha256(json.dumps({"files": files, "runtime": runtime}, sort_keys=True).encode())[:12]
+    return {"version": version, "files": files, "runtime": runtime}
+
+
+def _render(manifest: dict) -> str:
+    return json.dumps(manifest, indent=2) + "\n"
+
+
+def stamp_version(root: Path, version: str) -> None:
+    path = root / SERVICE_WORKER
+    source, count = VERSION_LINE.subn(f'const VERSION = "{version}";', path.read_text(encoding="utf-8"))
+    if count != 1:
+        raise SystemExit(f"{path}: no VERSION line to stamp")
+    path.write_text(source, encoding="utf-8")
+
+
+def stale_artifacts(root: Path) -> list[str]:
+    """The manifest and worker under root that do not match the files they describe."""
+    manifest = build_manifest(root)
+    stale = []
+    try:
+        committed = (root / MANIFEST).read_text(encoding="utf-8")
+    except OSError:
+        committed = None
+    if committed != _render(manifest):
+        stale.append(MANIFEST)
+    match = VERSION_LINE.search((root / SERVICE_WORKER).read_text(encoding="utf-8"))
+    if match is None or match.group(1) != manifest["version"]:
+        stale.append(SERVICE_WORKER)
+    return stale
+
+
+def write(root: Path) -> dict:
+    manifest = build_manifest(root)
+    (root / MANIFEST).write_text(_render(manifest), encoding="utf-8")
+    stamp_version(root, manifest["version"])
+    return manifest
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check that the manifest and sw.js are current")
+    parser.add_argument("--root", type=Path, default=ROOT, help="site directory (default: the repository)")
+    args = parser.parse_args(argv)
+    root = args.root.resolve()
+
+    stale = stale_files()
+    if stale:
+        raise SystemExit(f"{', '.join(path.name for path in stale)} stale: run scripts/build_catalog_snapshot.py first")
+
+    if args.check:
+        stale = stale_artifacts(root)
+        for name in stale:
+            print(f"{name} is stale: run scripts/build_sw_manifest.py", file=sys.stderr)
+        raise SystemExit(1 if stale else 0)
+
+    manifest = write(root)
+    size = sum((root / path).stat().st_size for path in manifest["files"])
+    print(f"wrote {MANIFEST}: version {manifest['version']}, {len(manifest['files'])} files, {size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
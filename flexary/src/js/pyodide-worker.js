@@ -1,10 +1,11 @@
 /**
  * Pyodide Web Worker — PDF generation off the main thread.
  *
- * The worker starts loading Pyodide + fpdf2 / pillow / qrcode as soon as the
- * page loads (triggered from ui.js).  By the time the user opens the PDF
- * modal and clicks Download, the runtime is already warm and the heavy
- * computation never touches the main thread.
+ * ui.js starts the worker once the page has painted and the visitor has
+ * workouts.  It then loads Pyodide + fpdf2 / pillow / qrcode and fetches the
+ * fonts and logo, and posts 'ready': by the time the user opens the PDF modal
+ * and clicks Download, only the rendering is left and the heavy computation
+ * never touches the main thread.
  */
 
 /* global loadPyodide */
@@ -46,9 +47,10 @@ sys.path.insert(0, '/')
 import models          # registers module; workouts_from_json is imported lazily inside pdf_worker
 import pdf_worker
 pdf_worker.set_app_root('${APP_ROOT}')
+await pdf_worker.warm_up()
   `);
 
-  self.postMessage({ type: 'ready' });
+  self.postMessage({ type: 'ready', ms: performance.now() });
 })().catch((err) => {
   self.postMessage({ type: 'init-error', message: String(err) });
 });
@@ -0,0 +1,7 @@
+// Offline cache (sw.js, with the committed sw-manifest.json).  Not registered
+// on localhost, where files change under it faster than the manifest is rebuilt.
+if ("serviceWorker" in navigator && location.hostname !== "localhost" && location.hostname !== "127.0.0.1") {
+  window.addEventListener("load", () => {
+    navigator.serviceWorker.register("./sw.js").catch(() => {});
+  });
+}
@@ -7,8 +7,10 @@ const LS_GDPR_KEY         = "flexary_gdpr_accepted";
 const LS_LANG_KEY         = "flexary_lang";
 
 // ---------------------------------------------------------------------------
-// Pyodide PDF Worker — started immediately so Pyodide + packages are warm by
-// the time the user opens the PDF modal and clicks Download.
+// Pyodide PDF Worker — warmed up in the background (window.flexaryWarmPdf,
+// called by main.py after first paint when there are workouts) so Pyodide,
+// the packages and the fonts are ready by the time the user clicks Download.
+// Progress is reported as window.flexaryPdfWarmup.
 // ---------------------------------------------------------------------------
 
 (function startPdfWorker() {
@@ -17,14 +19,49 @@ const LS_LANG_KEY         = "flexary_lang";
   const pending = new Map(); // id → { resolve, reject, btnEl, iconEl, origClass }
   let nextId = 0;
 
+  window.flexaryPdfWarmup = { state: 'idle' };
+
+  function reportWarmup(state, extra) {
+    window.flexaryPdfWarmup = { ...window.flexaryPdfWarmup, state, ...extra };
+    window.dispatchEvent(new CustomEvent('flexary-pdf-warmup', { detail: window.flexaryPdfWarmup }));
+  }
+
+  function showReady() {
+    const btn = document.getElementById('download-workouts');
+    if (btn) {
+      btn.classList.add('sidebar-action-btn--ready');
+      btn.title = (window.flexaryI18n && window.flexaryI18n.download_pdf_ready_title) || 'PDF ready';
+    }
+  }
+
+  function markReady() {
+    const startedAt = window.flexaryPdfWarmup.startedAt;
+    try {
+      performance.measure('flexary:pdf warm-up', { start: startedAt, end: performance.now() });
+    } catch (_) {}
+    reportWarmup('ready', { ms: Math.round(performance.now() - startedAt) });
+    showReady();
+  }
+
+  // A language switch re-translates the button's title back to the default.
+  window.addEventListener('flexary-language-change', () => {
+    if (workerReady) showReady();
+  });
+
   function getWorker() {
     if (!worker) {
+      reportWarmup('warming', { startedAt: performance.now() });
       worker = new Worker('./src/js/pyodide-worker.js');
       worker.onmessage = (event) => {
         const { type, id, bytes, message } = event.data;
 
         if (type === 'ready') {
           workerReady = true;
+          markReady();
+          return;
+        }
+        if (type === 'init-error') {
+          reportWarmup('error', { message });
           return;
         }
 
@@ -60,10 +97,12 @@ const LS_LANG_KEY         = "flexary_lang";
     });
   }
 
+  window.flexaryWarmPdf = () => {
+    getWorker();
+  };
+
   // Attach PDF download button handler once the DOM is ready.
   document.addEventListener('DOMContentLoaded', () => {
-    // Kick off worker initialisation immediately (pre-warm).
-    getWorker();
 
     const pdfDownloadBtn = document.getElementById('pdf-download-btn');
     if (!pdfDownloadBtn) return;
@@ -114,9 +153,11 @@ const LS_LANG_KEY         = "flexary_lang";
         // 6. Collect workout + catalog + locale data for the worker.
         const workoutsJson =
           localStorage.getItem(LS_WORKOUTS_KEY) || '[]';
+        // Only the exercises referenced by the workouts, columnar (see
+        // catalog.transfer_subset).
         const catalogJson =
-          typeof window.flexaryCatalogJson === 'string'
-            ? window.flexaryCatalogJson
+          typeof window.flexaryCatalogForPdf === 'function'
+            ? window.flexaryCatalogForPdf()
             : '{}';
         const localeJson = JSON.stringify(window.flexaryI18n || {});
         const isAuthenticated = !!(
@@ -219,6 +260,8 @@ document.addEventListener("DOMContentLoaded", function () {
     toggleBtn.setAttribute("aria-expanded", String(!hidden));
   }
 
+  window.addEventListener("flexary-language-change", updateButtonIcon);
+
   function setSidebarVisibility(hidden) {
     sidebar.classList.toggle("d-none", hidden);
     sidebarBackdrop.classList.add("d-none");
@@ -343,7 +386,13 @@ document.addEventListener("DOMContentLoaded", function () {
     renderSelectedLang(langSelect.value);
     langSelect.addEventListener("change", function () {
       localStorage.setItem(LS_LANG_KEY, langSelect.value);
-      location.reload();
+      // Pages that support it (index) switch in place; the others reload.
+      if (typeof window.flexarySetLanguage === "function") {
+        window.flexarySetLanguage(langSelect.value);
+        renderSelectedLang(langSelect.value);
+      } else {
+        location.reload();
+      }
     });
     if (langSelectTrigger && langSelectMenu) {
       langSelectTrigger.addEventListener("click", function (e) {
@@ -0,0 +1,34 @@
+"""Helpers for integer bitsets addressed by catalog slot (bit i = the record in slot i)."""
+
+import re
+
+# Set bit offsets of every byte value, and runs of non-zero bytes.
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+
+
+def from_positions(positions, size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def positions(mask: int) -> list[int]:
+    """Set bit positions of mask in ascending order.
+
+    Sparse masks skip their zero bytes in C (a regex over the little-endian
+    bytes), so the Python loop runs once per non-zero byte, not once per bit.
+    Dense masks, where that saves nothing, walk the binary string instead.
+    """
+    if mask.bit_count() * 2 > mask.bit_length():
+        return [i for i, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    result: list[int] = []
+    append = result.append
+    for run in _NONZERO_RUN.finditer(data):
+        for offset, value in enumerate(run.group(), run.start()):
+            base = offset << 3
+            for bit in _BYTE_BITS[value]:
+                append(base + bit)
+    return result
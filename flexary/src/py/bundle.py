@@ -0,0 +1,42 @@
+"""Mount the prebuilt module archive, when the page was configured with one.
+
+scripts/build_bundle.py packs the app modules (as precompiled .pyc, with their
+sources as a fallback) and the catalog data into one zip.  The bundled
+pyscript config fetches only that zip, this module and the entry script, so
+the entry script calls mount() before importing anything else from the app.
+Without the archive (the source config), mount() does nothing.
+"""
+
+import os
+import sys
+import zipfile
+
+ARCHIVE = "flexary_bundle.zip"
+
+# (start, end) in performance.now() ms, for perf to record once it is importable.
+mounted: tuple[float, float] | None = None
+
+
+def _now() -> float:
+    try:
+        from js import performance
+
+        return float(performance.now())
+    except Exception:
+        return 0.0
+
+
+def mount() -> bool:
+    global mounted
+    if mounted is not None:
+        return True
+    if not os.path.exists(ARCHIVE):
+        return False
+    started_at = _now()
+    sys.path.insert(0, os.path.abspath(ARCHIVE))
+    # Data files are read by path, so they are written next to the archive.
+    with zipfile.ZipFile(ARCHIVE) as archive:
+        data = [name for name in archive.namelist() if not name.endswith((".py", ".pyc"))]
+        archive.extractall(members=data)
+    mounted = (started_at, _now())
+    return True
@@ -1,36 +1,291 @@
+import asyncio
 import csv
+import hashlib
 import json
+import logging
+from bisect import bisect_left, bisect_right, insort
 from pathlib import Path
 
-from exercise_records import ExerciseRecord, normalize_exercise_records
-
-_base_exercises: list[ExerciseRecord] | None = None
-_all_exercises: list[ExerciseRecord] = []
-_exercise_by_id: dict[str, ExerciseRecord] = {}
+import bitsets
+from exercise_records import (
+    CompactExerciseRecord,
+    ExerciseRecord,
+    compact_exercise_records,
+    normalize_exercise_record,
+    normalize_exercise_records,
+)
+from search_index import SearchIndex, tokenize
+
+_base_exercises: list[CompactExerciseRecord] | None = None
+_base_facet_positions: dict[str, dict[str, list[int]]] = {}
+_all_exercises: list[CompactExerciseRecord] = []
+_exercise_by_id: dict[str, CompactExerciseRecord] = {}
 _category_count: dict[str, int] = {}
 _body_parts_list: list[str] = []
 _primary_muscles_list: list[str] = []
+# _all_exercises is in display order: custom exercises by name, then the base
+# catalog.  _custom_names and _custom_slots follow the custom part of it, so
+# upsert_custom() can bisect for a custom exercise's place.
+_custom_names: list[str] = []
+_custom_slots: list[int] = []
+# Bit i of every facet mask and search posting stands for _slots[i].  Base
+# exercises hold slots [0, len(_base_exercises)) in catalog order; custom
+# exercises take the slots after them, reusing freed ones, so adding or
+# removing one only touches the masks of its own values and tokens.
+_slots: list[CompactExerciseRecord | None] = []
+_free_slots: list[int] = []
+
+# Facet index: for every facet field, one bitmask per value where bit i is set
+# when _slots[i] carries that value.  Filtering and facet counting then become
+# integer AND/OR plus popcount instead of re-splitting CSV strings.
+FACET_FIELDS = ("category", "body_parts", "primary_muscles")
+_facet_index: dict[str, dict[str, int]] = {field: {} for field in FACET_FIELDS}
+_search_index: SearchIndex = SearchIndex([])
+_full_mask: int = 0
+# Alternatives graph.  _alternatives maps an exercise id to the records its
+# "alternatives" column lists, resolved and in listed order; _alternative_of is
+# the reverse index from a listed id to the ids listing it, kept even for ids
+# that are not in the catalog so that a deleted custom exercise's referrers can
+# be found; _dangling_alternatives maps an exercise id to the listed ids that
+# do not resolve.
+_alternatives: dict[str, tuple[CompactExerciseRecord, ...]] = {}
+_alternative_of: dict[str, list[str]] = {}
+_dangling_alternatives: dict[str, tuple[str, ...]] = {}
+_reported_dangling: set[tuple[str, str]] = set()
+_log = logging.getLogger(__name__)
+# Bumped on every refresh(), upsert_custom() and remove_custom() so callers
+# holding derived data (rendered cards, cached query results) can tell when to
+# revalidate it.
+_version: int = 0
+
+
+SNAPSHOT_VERSION = 2
+# Long free-text fields kept out of the startup snapshot.  Base records carry
+# them as empty strings; the text lives in a separate details file that is
+# fetched on first use (see fetch_details()).  Custom exercises keep theirs.
+DETAIL_FIELDS = ("instructions",)
+DETAILS_VERSION = 1
+DETAILS_URL = "./data/exercise_details.json"
+# Only fetched when there is no usable snapshot; it is not in pyscript.toml.
+CSV_URL = "./data/exercises_library.csv"
+_SNAPSHOT_FIELDS = tuple(
+    field for field in ExerciseRecord.__annotations__ if field != "is_custom" and field not in DETAIL_FIELDS
+)
+
+# sha256 of the CSV the base records came from, as recorded in the snapshot;
+# a details file is only used when it was built from the same CSV.
+_source_sha256: str = ""
+# Base exercise id -> DETAIL_FIELDS values, or None until loaded.
+_details: dict[str, tuple[str, ...]] | None = None
+_details_task = None
+
+
+def _read_csv(path: Path) -> list[CompactExerciseRecord]:
+    with path.open(mode="r", encoding="utf-8") as csv_file:
+        reader = csv.DictReader(csv_file)
+        return sorted(
+            compact_exercise_records(normalize_exercise_records(list(reader), is_custom=False)),
+            key=lambda ex: ex.name,
+        )
+
+
+def _split_details(
+    records: list[CompactExerciseRecord],
+) -> tuple[list[CompactExerciseRecord], dict[str, tuple[str, ...]]]:
+    """Return (records without DETAIL_FIELDS, {id: DETAIL_FIELDS values})."""
+    details = {str(ex["id"]): tuple(ex[field] for field in DETAIL_FIELDS) for ex in records}
+    slim = [
+        CompactExerciseRecord({**ex, **{field: "" for field in DETAIL_FIELDS}})
+        for ex in records
+    ]
+    return slim, details
+
+
+def _facet_positions(records: list[CompactExerciseRecord], offset: int = 0) -> dict[str, dict[str, list[int]]]:
+    facet_positions: dict[str, dict[str, list[int]]] = {field: {} for field in FACET_FIELDS}
+    for position, exercise in enumerate(records, start=offset):
+        for field in FACET_FIELDS:
+            positions_by_value = facet_positions[field]
+            for value in exercise.split(field):
+                positions_by_value.setdefault(value, []).append(position)
+    return facet_positions
+
+
+def source_hash(csv_path: Path) -> str:
+    return hashlib.sha256(csv_path.read_bytes()).hexdigest()
+
+
+def build_snapshot(csv_path: Path) -> dict:
+    """Pre-normalized, pre-sorted base catalog plus its facet positions.
+
+    Rows are stored column-ordered (one list per record, in _SNAPSHOT_FIELDS
+    order) to keep the file compact; the facet positions give refresh() the
+    base records' facet lists and counts without re-splitting them.
+    DETAIL_FIELDS are left out; build_details() writes them separately.
+    """
+    records = _read_csv(csv_path)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "source_sha256": source_hash(csv_path),
+        "fields": list(_SNAPSHOT_FIELDS),
+        "rows": [[ex.get(field, "") for field in _SNAPSHOT_FIELDS] for ex in records],
+        "facets": _facet_positions(records),
+    }
+
+
+def build_details(csv_path: Path) -> dict:
+    """The DETAIL_FIELDS of every base exercise, keyed by id."""
+    _slim, details = _split_details(_read_csv(csv_path))
+    return {
+        "version": DETAILS_VERSION,
+        "source_sha256": source_hash(csv_path),
+        "fields": list(DETAIL_FIELDS),
+        "details": {exercise_id: list(values) for exercise_id, values in details.items()},
+    }
+
+
+def _read_snapshot(snapshot_path: Path) -> tuple[list[CompactExerciseRecord], dict, str] | None:
+    if not snapshot_path.exists():
+        return None
+    try:
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_VERSION
+        or snapshot.get("fields") != list(_SNAPSHOT_FIELDS)
+    ):
+        return None
+    fields = snapshot["fields"]
+    records = [CompactExerciseRecord(dict(zip(fields, row))) for row in snapshot["rows"]]
+    return records, snapshot["facets"], str(snapshot.get("source_sha256", ""))
+
+
+def _fetch_csv(csv_path: Path) -> bool:
+    try:
+        from pyodide.http import open_url
+
+        csv_path.write_text(open_url(CSV_URL).getvalue(), encoding="utf-8")
+        return True
+    except Exception:
+        return False
+
+
+def _parse_csv(csv_path: Path) -> tuple[list[CompactExerciseRecord], dict[str, dict[str, list[int]]]]:
+    global _source_sha256, _details
+    _source_sha256 = source_hash(csv_path)
+    records, _details = _split_details(_read_csv(csv_path))
+    return records, _facet_positions(records)
 
 
-def _load_base_exercises(csv_file_path: str = "exercises.csv") -> list[ExerciseRecord]:
+def _load_base_exercises(
+    csv_file_path: str = "exercises.csv",
+    snapshot_file_path: str = "exercises_snapshot.json",
+) -> tuple[list[CompactExerciseRecord], dict[str, dict[str, list[int]]]]:
+    """Load the base catalog, preferring the build-time snapshot over the CSV.
+
+    The snapshot is trusted as is: build_catalog_snapshot.py --check and the
+    Playwright suite are what catch one that is stale.  The CSV is only parsed (and in the browser
+    fetched, as it is not in [files]) when there is no usable snapshot.
+
+    Either way the returned records come without DETAIL_FIELDS.  When the CSV
+    had to be parsed its details are kept as well, so no fetch is needed later.
+    """
+    global _source_sha256
+    data_dir = Path(__file__).resolve().parents[2] / "data"
     candidates = [
-        Path(csv_file_path),
-        Path("data/exercises_library.csv"),
-        Path(__file__).resolve().parents[2] / "data" / "exercises_library.csv",
+        (Path(csv_file_path), Path(snapshot_file_path)),
+        (Path("data/exercises_library.csv"), Path("data/exercises_snapshot.json")),
+        (data_dir / "exercises_library.csv", data_dir / "exercises_snapshot.json"),
     ]
-    for path in candidates:
+    for csv_path, snapshot_path in candidates:
+        snapshot = _read_snapshot(snapshot_path)
+        if snapshot is not None:
+            records, facet_positions, _source_sha256 = snapshot
+            return records, facet_positions
+        if csv_path.exists():
+            return _parse_csv(csv_path)
+    if _fetch_csv(Path(csv_file_path)):
+        return _parse_csv(Path(csv_file_path))
+    raise FileNotFoundError(snapshot_file_path)
+
+
+def _apply_details(payload) -> bool:
+    global _details
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != DETAILS_VERSION
+        or payload.get("fields") != list(DETAIL_FIELDS)
+        or payload.get("source_sha256") != _source_sha256
+    ):
+        return False
+    _details = {str(exercise_id): tuple(values) for exercise_id, values in payload["details"].items()}
+    return True
+
+
+def _read_details_file() -> bool:
+    data_dir = Path(__file__).resolve().parents[2] / "data"
+    for path in (Path("exercise_details.json"), Path("data/exercise_details.json"), data_dir / "exercise_details.json"):
         if path.exists():
-            with path.open(mode="r", encoding="utf-8") as csv_file:
-                reader = csv.DictReader(csv_file)
-                return sorted(
-                    normalize_exercise_records(list(reader), is_custom=False),
-                    key=lambda ex: ex["name"],
-                )
-    raise FileNotFoundError(csv_file_path)
+            try:
+                return _apply_details(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                return False
+    return False
+
+
+def details_loaded() -> bool:
+    return _details is not None
 
 
-def _split_csv_field(value: str) -> list[str]:
-    return [item.strip() for item in str(value).split(",") if item.strip()]
+def load_details() -> bool:
+    """Load the details file from disk (CPython tools); returns whether details are available."""
+    return details_loaded() or _read_details_file()
+
+
+async def _fetch_details(url: str) -> bool:
+    global _details
+    try:
+        from pyodide.http import pyfetch
+
+        response = await pyfetch(url)
+        if response.ok and _apply_details(await response.json()):
+            return True
+    except Exception:
+        pass
+    if _read_details_file():
+        return True
+    # Stale or missing details file: the CSV still has the text.
+    paths = [path for path in (Path("exercises.csv"), Path("data/exercises_library.csv")) if path.exists()]
+    if not paths and _fetch_csv(Path("exercises.csv")):
+        paths = [Path("exercises.csv")]
+    for path in paths:
+        if source_hash(path) == _source_sha256:
+            _slim, _details = _split_details(_read_csv(path))
+            return True
+    return False
+
+
+async def fetch_details(url: str = DETAILS_URL) -> bool:
+    """Fetch and cache the base exercises' DETAIL_FIELDS; concurrent callers share one request."""
+    global _details_task
+    if _details is not None:
+        return True
+    if _details_task is None or (_details_task.done() and not _details_task.result()):
+        _details_task = asyncio.ensure_future(_fetch_details(url))
+    return await _details_task
+
+
+def exercise_detail(exercise_id, field: str) -> str:
+    """A DETAIL_FIELDS value; empty while the details of a base exercise are not loaded."""
+    exercise = get_exercise(exercise_id)
+    if not exercise:
+        return ""
+    if field not in DETAIL_FIELDS or exercise.get("is_custom") == "true":
+        return exercise.get(field, "")
+    values = (_details or {}).get(str(exercise_id))
+    return values[DETAIL_FIELDS.index(field)] if values else ""
 
 
 def parse_custom_exercises(raw: str | None) -> list[ExerciseRecord]:
@@ -46,74 +301,307 @@ def parse_custom_exercises(raw: str | None) -> list[ExerciseRecord]:
 
 
 def initialize(custom_exercises: list[dict] | None = None) -> None:
-    global _base_exercises
+    global _base_exercises, _base_facet_positions
     if _base_exercises is None:
-        _base_exercises = _load_base_exercises()
+        _base_exercises, _base_facet_positions = _load_base_exercises()
     refresh(custom_exercises or [])
 
 
 def refresh(custom_exercises: list[dict] | None = None) -> None:
     global _all_exercises, _exercise_by_id, _category_count, _body_parts_list, _primary_muscles_list
+    global _facet_index, _search_index, _full_mask, _version, _custom_names, _custom_slots, _slots, _free_slots
 
     if _base_exercises is None:
         initialize(custom_exercises)
         return
 
-    normalized_customs = normalize_exercise_records(custom_exercises or [], is_custom=True)
-    merged = sorted(normalized_customs, key=lambda ex: ex["name"]) + _base_exercises
-    exercise_by_id: dict[str, ExerciseRecord] = {}
-    category_count: dict[str, int] = {}
-    body_parts_seen: set[str] = set()
-    body_parts_list: list[str] = []
-    primary_muscles_seen: set[str] = set()
-    primary_muscles_list: list[str] = []
-
-    for exercise in merged:
-        exercise_by_id[str(exercise["id"])] = exercise
-
-        for category in _split_csv_field(exercise.get("category", "")):
-            category_count[category] = category_count.get(category, 0) + 1
-
-        for body_part in _split_csv_field(exercise.get("body_parts", "")):
-            if body_part not in body_parts_seen:
-                body_parts_seen.add(body_part)
-                body_parts_list.append(body_part)
-
-        for muscle in _split_csv_field(exercise.get("primary_muscles", "")):
-            if muscle not in primary_muscles_seen:
-                primary_muscles_seen.add(muscle)
-                primary_muscles_list.append(muscle)
-
-    body_parts_list.sort()
-    primary_muscles_list.sort()
+    normalized_customs = compact_exercise_records(normalize_exercise_records(custom_exercises or [], is_custom=True))
+    sorted_customs = sorted(normalized_customs, key=lambda ex: ex.name)
+    merged = sorted_customs + _base_exercises
+    exercise_by_id: dict[str, CompactExerciseRecord] = {str(exercise["id"]): exercise for exercise in merged}
+
+    # The base records' facet positions were computed once at load time (or
+    # shipped in the snapshot); only the customs, in the slots after them,
+    # are split here.
+    slots = _base_exercises + sorted_customs
+    base_count = len(_base_exercises)
+    custom_positions = _facet_positions(sorted_customs, offset=base_count)
+    facet_index: dict[str, dict[str, int]] = {}
+    for field in FACET_FIELDS:
+        masks = {
+            value: bitsets.from_positions(positions, len(slots))
+            for value, positions in _base_facet_positions.get(field, {}).items()
+        }
+        for value, positions in custom_positions[field].items():
+            masks[value] = masks.get(value, 0) | bitsets.from_positions(positions, len(slots))
+        facet_index[field] = masks
 
     _all_exercises = merged
+    _custom_names = [ex["name"] for ex in sorted_customs]
+    _custom_slots = list(range(base_count, len(slots)))
+    _slots = slots
+    _free_slots = []
     _exercise_by_id = exercise_by_id
-    _category_count = category_count
-    _body_parts_list = body_parts_list
-    _primary_muscles_list = primary_muscles_list
-
+    _category_count = {category: mask.bit_count() for category, mask in facet_index["category"].items()}
+    _body_parts_list = sorted(facet_index["body_parts"])
+    _primary_muscles_list = sorted(facet_index["primary_muscles"])
+    _facet_index = facet_index
+    _search_index = SearchIndex(slots)
+    _full_mask = (1 << len(slots)) - 1
+    _build_alternatives()
+    _warn_dangling_alternatives()
+    _version += 1
+    _sync_state(include_base=True)
+
+
+def _link_alternatives(exercise: CompactExerciseRecord) -> None:
+    for target_id in dict.fromkeys(exercise.split("alternatives")):
+        _alternative_of.setdefault(target_id, []).append(str(exercise["id"]))
+
+
+def _unlink_alternatives(exercise: CompactExerciseRecord) -> None:
+    source_id = str(exercise["id"])
+    for target_id in dict.fromkeys(exercise.split("alternatives")):
+        sources = _alternative_of.get(target_id, [])
+        if source_id in sources:
+            sources.remove(source_id)
+        if not sources:
+            _alternative_of.pop(target_id, None)
+
+
+def _resolve_alternatives(source_id: str) -> None:
+    exercise = _exercise_by_id.get(source_id)
+    resolved: list[CompactExerciseRecord] = []
+    missing: list[str] = []
+    for target_id in exercise.split("alternatives") if exercise is not None else ():
+        target = _exercise_by_id.get(target_id)
+        if target is None:
+            missing.append(target_id)
+        else:
+            resolved.append(target)
+    if resolved:
+        _alternatives[source_id] = tuple(resolved)
+    else:
+        _alternatives.pop(source_id, None)
+    if missing:
+        _dangling_alternatives[source_id] = tuple(missing)
+    else:
+        _dangling_alternatives.pop(source_id, None)
+
+
+def _build_alternatives() -> None:
+    _alternatives.clear()
+    _alternative_of.clear()
+    _dangling_alternatives.clear()
+    for exercise in _all_exercises:
+        _link_alternatives(exercise)
+    for exercise in _all_exercises:
+        _resolve_alternatives(str(exercise["id"]))
+
+
+def _warn_dangling_alternatives() -> None:
+    # Once per link and session; the detail page is where users see them.
+    for source_id, missing in _dangling_alternatives.items():
+        for target_id in missing:
+            if (source_id, target_id) not in _reported_dangling:
+                _reported_dangling.add((source_id, target_id))
+                _log.warning("exercise %s lists unknown alternative %s", source_id, target_id)
+
+
+def _relink_alternatives(exercise_id: str) -> None:
+    """Re-resolve exercise_id's own alternatives and those of every exercise listing it."""
+    _resolve_alternatives(exercise_id)
+    for source_id in _alternative_of.get(exercise_id, ()):
+        _resolve_alternatives(source_id)
+
+
+def _sync_state(include_base: bool = False) -> None:
     try:
         import state
 
-        state.base_data = list(_base_exercises)
-        state.data = merged
+        if include_base:
+            state.base_data = list(_base_exercises)
+        state.data = _all_exercises
         state.category_count.clear()
-        state.category_count.update(category_count)
-        state.body_parts_list[:] = body_parts_list
-        state.primary_muscles_list[:] = primary_muscles_list
+        state.category_count.update(_category_count)
+        state.body_parts_list[:] = _body_parts_list
+        state.primary_muscles_list[:] = _primary_muscles_list
     except Exception:
         pass
 
 
-def all_exercises() -> list[ExerciseRecord]:
+def _facet_list(field: str) -> list[str] | None:
+    if field == "body_parts":
+        return _body_parts_list
+    if field == "primary_muscles":
+        return _primary_muscles_list
+    return None
+
+
+def _insert(exercise: CompactExerciseRecord) -> None:
+    global _full_mask
+    if _free_slots:
+        slot = _free_slots.pop()
+        _slots[slot] = exercise
+    else:
+        slot = len(_slots)
+        _slots.append(exercise)
+    index = bisect_right(_custom_names, exercise["name"])
+    _all_exercises.insert(index, exercise)
+    _custom_names.insert(index, exercise["name"])
+    _custom_slots.insert(index, slot)
+    _exercise_by_id[str(exercise["id"])] = exercise
+
+    bit = 1 << slot
+    # Counts are per record, like the popcounts refresh() takes, so a value
+    # repeated within one record counts once.
+    for field in FACET_FIELDS:
+        masks = _facet_index[field]
+        values = set(exercise.split(field))
+        for value in values:
+            if value not in masks:
+                masks[value] = 0
+                sorted_values = _facet_list(field)
+                if sorted_values is not None:
+                    insort(sorted_values, value)
+            masks[value] |= bit
+        if field == "category":
+            for value in values:
+                _category_count[value] = _category_count.get(value, 0) + 1
+
+    _search_index.add(slot, exercise)
+    _full_mask |= bit
+    _link_alternatives(exercise)
+    _relink_alternatives(str(exercise["id"]))
+
+
+def _remove(index: int) -> CompactExerciseRecord:
+    global _full_mask
+    exercise = _all_exercises.pop(index)
+    _custom_names.pop(index)
+    slot = _custom_slots.pop(index)
+    _slots[slot] = None
+    _free_slots.append(slot)
+    if _exercise_by_id.get(str(exercise["id"])) is exercise:
+        del _exercise_by_id[str(exercise["id"])]
+
+    bit = 1 << slot
+    for field in FACET_FIELDS:
+        masks = _facet_index[field]
+        values = set(exercise.split(field))
+        for value in values:
+            mask = masks.get(value, 0) & ~bit
+            if mask:
+                masks[value] = mask
+                continue
+            masks.pop(value, None)
+            sorted_values = _facet_list(field)
+            if sorted_values is not None:
+                sorted_values.pop(bisect_left(sorted_values, value))
+        if field == "category":
+            for value in values:
+                remaining = _category_count.get(value, 0) - 1
+                if remaining > 0:
+                    _category_count[value] = remaining
+                else:
+                    _category_count.pop(value, None)
+
+    _search_index.discard(slot, exercise)
+    _full_mask &= ~bit
+    _unlink_alternatives(exercise)
+    _relink_alternatives(str(exercise["id"]))
+    return exercise
+
+
+def _custom_index(exercise_id: str) -> int | None:
+    """Index of a custom exercise in _all_exercises (and _custom_names/_custom_slots)."""
+    existing = _exercise_by_id.get(exercise_id)
+    if existing is None or existing.get("is_custom") != "true":
+        return None
+    start = bisect_left(_custom_names, existing["name"])
+    end = bisect_right(_custom_names, existing["name"])
+    for index in range(start, end):
+        if _all_exercises[index] is existing:
+            return index
+    return None
+
+
+def upsert_custom(record: dict) -> CompactExerciseRecord:
+    """Add or replace one custom exercise without rebuilding the catalog.
+
+    Its place in display order is found by bisecting the custom names.  The
+    record keeps a fixed bit slot, so only the facet masks and search postings
+    of its own values and tokens are patched.
+    """
+    global _version
+    if _base_exercises is None:
+        initialize([])
+
+    exercise = CompactExerciseRecord(normalize_exercise_record(record, is_custom=True))
+    index = _custom_index(str(exercise["id"]))
+    if index is not None:
+        _remove(index)
+    _insert(exercise)
+    _version += 1
+    _sync_state()
+    return exercise
+
+
+def remove_custom(exercise_id) -> bool:
+    """Remove one custom exercise; returns False when it is not in the catalog."""
+    global _version
+    index = _custom_index(str(exercise_id))
+    if index is None:
+        return False
+    _remove(index)
+    _version += 1
+    _sync_state()
+    return True
+
+
+def version() -> int:
+    return _version
+
+
+def all_exercises() -> list[CompactExerciseRecord]:
     return _all_exercises
 
 
-def get_exercise(exercise_id) -> ExerciseRecord | dict:
+def get_exercise(exercise_id) -> CompactExerciseRecord | dict:
     return _exercise_by_id.get(str(exercise_id), {})
 
 
+def alternatives(exercise_id) -> tuple[CompactExerciseRecord, ...]:
+    """Records listed as alternatives of exercise_id; see dangling_alternatives() for the rest."""
+    return _alternatives.get(str(exercise_id), ())
+
+
+def dangling_alternatives(exercise_id) -> tuple[str, ...]:
+    """Ids listed as alternatives of exercise_id that are not in the catalog."""
+    return _dangling_alternatives.get(str(exercise_id), ())
+
+
+def unknown_exercise_ids(exercise_ids) -> list[str]:
+    return [exercise_id for exercise_id in exercise_ids if str(exercise_id) not in _exercise_by_id]
+
+
+TRANSFER_VERSION = 1
+
+
+def transfer_subset(exercise_ids, fields) -> dict:
+    """Columnar extract of some exercises for another runtime (the PDF worker).
+
+    Returns {"version", "fields", "rows": {id: [value per field]}}; ids that are
+    not in the catalog are left out.
+    """
+    rows = {}
+    for exercise_id in exercise_ids:
+        exercise = _exercise_by_id.get(str(exercise_id))
+        if exercise is not None:
+            rows[str(exercise_id)] = [exercise.get(field, "") for field in fields]
+    return {"version": TRANSFER_VERSION, "fields": list(fields), "rows": rows}
+
+
 def category_count() -> dict[str, int]:
     return _category_count
 
@@ -124,3 +612,70 @@ def body_parts_list() -> list[str]:
 
 def primary_muscles_list() -> list[str]:
     return _primary_muscles_list
+
+
+def full_mask() -> int:
+    """Bitmask selecting every exercise in all_exercises() (one bit per occupied slot)."""
+    return _full_mask
+
+
+def facet_index(field: str) -> dict[str, int]:
+    return _facet_index.get(field, {})
+
+
+def facet_indexes() -> dict[str, dict[str, int]]:
+    return _facet_index
+
+
+def selection_mask(field: str, values) -> int:
+    """OR of the masks of the selected facet values; no selection matches everything."""
+    if not values:
+        return _full_mask
+    masks = _facet_index.get(field, {})
+    mask = 0
+    for value in values:
+        mask |= masks.get(value, 0)
+    return mask
+
+
+def search(search_str: str) -> dict[int, float] | None:
+    """Map slot -> rank for exercises matching search_str.
+
+    Returns None when search_str has nothing to search for, so callers can
+    tell "no search" apart from "no matches".
+    """
+    if not tokenize(search_str):
+        return None
+    return _search_index.search(search_str)
+
+
+def search_mask(search_str: str) -> int:
+    """Bitmask of exercises matching search_str (see search_index)."""
+    return mask_of(search(search_str))
+
+
+def mask_of(ranks: dict[int, float] | None) -> int:
+    if ranks is None:
+        return _full_mask
+    return bitsets.from_positions(list(ranks), len(_slots))
+
+
+def exercises_in(mask: int, ranks: dict[int, float] | None = None) -> list[CompactExerciseRecord]:
+    """Return the exercises selected by mask.
+
+    Without ranks they come in all_exercises() order; with the ranks from
+    search() they are ordered by rank, then by all_exercises() order.
+    """
+    if ranks is None and mask == _full_mask:
+        return list(_all_exercises)
+    base_count = len(_base_exercises or ())
+    custom_bits = bin(mask >> base_count)[:1:-1]
+    slots = [
+        slot for slot in _custom_slots
+        if slot - base_count < len(custom_bits) and custom_bits[slot - base_count] == "1"
+    ]
+    slots += bitsets.positions(mask & ((1 << base_count) - 1))
+    if ranks is not None:
+        slots = [slot for slot in slots if slot in ranks]
+        slots.sort(key=ranks.__getitem__)
+    return [_slots[slot] for slot in slots]
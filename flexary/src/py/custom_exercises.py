@@ -1,11 +1,11 @@
 import catalog
-from pyodide.ffi import create_proxy
 from pyscript import document
 from pyweb import pydom
 
+import proxies
 import state
 from common import extract_yt_id, is_valid_yt_url, make_input_group, make_warning_el, show_warning, yt_id_to_url
-from exercise_records import normalize_exercise_record
+from exercise_records import list_field, normalize_exercise_record
 from filters import update as update_filters
 from i18n import t
 from workouts import render_workouts
@@ -29,8 +29,7 @@ def _inject_modal_css() -> None:
     document.head.appendChild(style)
 
 
-def _rebuild_data() -> None:
-    catalog.refresh(state.custom_exercises)
+def _refresh_library() -> None:
     search_val = pydom["#search-input"][0]._js.value
     update_filters(search_val)
 
@@ -43,6 +42,7 @@ def _open_custom_modal(ex: dict | None = None) -> None:
 
     overlay = document.createElement("div")
     overlay.className = "cm-overlay"
+    owner = proxies.scope("custom_exercises:modal", overlay)
 
     modal = document.createElement("div")
     modal.className = "cm-box"
@@ -201,6 +201,11 @@ def _open_custom_modal(ex: dict | None = None) -> None:
         alternatives_input.value = ex.get("alternatives", "")
     step2.appendChild(make_input_group(t("alternatives_label"), alternatives_input))
 
+    # Unknown ids only warn: they are saved and shown as missing on the detail
+    # page, and an id left behind by a deleted custom must not block edits.
+    warning2 = make_warning_el()
+    step2.appendChild(warning2)
+
     footer2 = document.createElement("div")
     footer2.style.display = "flex"
     footer2.style.justifyContent = "space-between"
@@ -265,6 +270,15 @@ def _open_custom_modal(ex: dict | None = None) -> None:
         step1.style.display = "none"
         step2.style.display = "flex"
         step_el.textContent = t("step_indicator", step=2, total=2)
+        on_alternatives_input(evt)
+
+    def on_alternatives_input(evt):
+        alternative_ids = list_field({"alternatives": alternatives_input.value}, "alternatives")
+        unknown_ids = catalog.unknown_exercise_ids(alternative_ids)
+        if unknown_ids:
+            show_warning(warning2, t("alternatives_unknown", ids=", ".join(unknown_ids)))
+        else:
+            warning2.style.display = "none"
 
     def on_back(evt):
         step2.style.display = "none"
@@ -297,6 +311,7 @@ def _open_custom_modal(ex: dict | None = None) -> None:
             ex.clear()
             ex.update(normalized_payload)
             state.save_custom_exercises()
+            catalog.upsert_custom(ex)
             for w in state.workouts:
                 for wex in w.exercises:
                     if str(wex.id) == exercise_id:
@@ -306,16 +321,18 @@ def _open_custom_modal(ex: dict | None = None) -> None:
         else:
             state.custom_exercises.append(normalized_payload)
             state.save_custom_exercises()
+            catalog.upsert_custom(normalized_payload)
 
-        _rebuild_data()
+        _refresh_library()
         overlay.remove()
 
-    cancel_btn.onclick = create_proxy(on_cancel)
-    cancel2_btn.onclick = create_proxy(on_cancel)
-    next_btn.onclick = create_proxy(on_next)
-    back_btn.onclick = create_proxy(on_back)
-    confirm_btn.onclick = create_proxy(on_confirm)
-    overlay.addEventListener("click", create_proxy(on_overlay_click))
+    owner.listen(cancel_btn, "click", on_cancel)
+    owner.listen(cancel2_btn, "click", on_cancel)
+    owner.listen(next_btn, "click", on_next)
+    owner.listen(back_btn, "click", on_back)
+    owner.listen(confirm_btn, "click", on_confirm)
+    owner.listen(alternatives_input, "input", on_alternatives_input)
+    owner.listen(overlay, "click", on_overlay_click)
 
 
 def delete_custom_exercise(event) -> None:
@@ -332,7 +349,8 @@ def delete_custom_exercise(event) -> None:
         w.exercises[:] = [ex for ex in w.exercises if str(ex.id) != exercise_id]
     state.save_workouts()
     render_workouts(state.workouts)
-    _rebuild_data()
+    catalog.remove_custom(exercise_id)
+    _refresh_library()
 
 
 def open_add_custom_modal(event) -> None:
@@ -1,8 +1,15 @@
+import asyncio
+
+import bundle
+
+bundle.mount()
+
 import catalog
 from js import URLSearchParams, localStorage
 from pyscript import window
 from pyweb import pydom
 from common import copyright, current_version, extract_yt_id
+from exercise_records import key_cue_list, list_field
 from i18n import t, apply_html_translations
 from state import ls_custom_exercises_key
 
@@ -26,7 +33,7 @@ data = catalog.get_exercise(exercise_id)
 pydom["#exercise-name"][0]._js.textContent = data.get("name", "")
 pydom["#breadcrumb-exercise-name"][0]._js.textContent = data.get("name", "")
 
-categories = data.get("category", "").split(",")
+categories = list_field(data, "category") or ("",)
 category_badge_element = pydom["#category-badge"][0]
 clean_cat_badge = category_badge_element.clone()
 for i, category in enumerate(categories):
@@ -37,7 +44,7 @@ for i, category in enumerate(categories):
     if i > 0:
         pydom["#badges-container"][0]._js.append(cat_badge._js)
 
-body_parts_badges = data.get("body_parts", "").split(",")
+body_parts_badges = list_field(data, "body_parts") or ("",)
 for i, badge in enumerate(body_parts_badges):
     new_badge = (
         pydom["#body-parts-badge"][0].clone()
@@ -56,7 +63,7 @@ def open_exercise(event):
 
 equipment = data.get("equipment", "").strip()
 if equipment:
-    all_equipment = equipment.split(",")
+    all_equipment = list_field(data, "equipment")
     for i, item in enumerate(all_equipment):
         new_item = pydom["#equipment-item"][0].clone() if i > 0 else pydom["#equipment-item"][0]
         new_item._js.textContent = item.strip()
@@ -84,18 +91,25 @@ else:
     placeholder.appendChild(label)
     ratio_div.replaceWith(placeholder)
 
-instructions = data.get("instructions", "")
-if instructions:
-    pydom["#exercise-instructions"][0]._js.textContent = instructions
-else:
-    pydom["#instructions-not-available"][0]._js.classList.remove("d-none")
+
+async def _render_instructions() -> None:
+    # Base exercises' instructions are not part of the startup catalog.
+    await catalog.fetch_details()
+    instructions = catalog.exercise_detail(exercise_id, "instructions")
+    if instructions:
+        pydom["#exercise-instructions"][0]._js.textContent = instructions
+    else:
+        pydom["#instructions-not-available"][0]._js.classList.remove("d-none")
+
+
+asyncio.ensure_future(_render_instructions())
 
 primary_muscles = data.get("primary_muscles", "")
 secondary_muscles = data.get("secondary_muscles", "")
 if primary_muscles:
     pydom["#primary-muscles-section"][0]._js.classList.remove("d-none")
     chips = pydom["#primary-muscles-chips"][0]._js
-    for muscle in primary_muscles.split(","):
+    for muscle in list_field(data, "primary_muscles"):
         chip = window.document.createElement("span")
         chip.className = "muscle-chip"
         chip.textContent = muscle.strip()
@@ -103,7 +117,7 @@ if primary_muscles:
 if secondary_muscles:
     pydom["#secondary-muscles-section"][0]._js.classList.remove("d-none")
     chips = pydom["#secondary-muscles-chips"][0]._js
-    for muscle in secondary_muscles.split(","):
+    for muscle in list_field(data, "secondary_muscles"):
         chip = window.document.createElement("span")
         chip.className = "muscle-chip muscle-chip--secondary"
         chip.textContent = muscle.strip()
@@ -111,32 +125,33 @@ if secondary_muscles:
 if not primary_muscles and not secondary_muscles:
     pydom["#muscles-not-available"][0]._js.classList.remove("d-none")
 
-cues = data.get("key_cues", "")
+cues = key_cue_list(data)
 if cues:
-    if "\\," in cues:
-        cues = cues.replace("\\,", "|")
-    all_cues = cues.split(",")
-    for i, cue in enumerate(all_cues):
-        if "|" in cue:
-            cue = cue.replace("|", ", ")
+    for i, cue in enumerate(cues):
         new_cue = pydom["#key-cue"][0].clone() if i > 0 else pydom["#key-cue"][0]
-        new_cue._js.textContent = cue.strip()
+        new_cue._js.textContent = cue
         pydom["#key-cues-container"][0]._js.append(new_cue._js)
     pydom["#key-cues-container"][0]._js.classList.remove("d-none")
 else:
     pydom["#cues-not-available"][0]._js.classList.remove("d-none")
 
-alternatives = data.get("alternatives", "")
-if alternatives:
-    for i, alternative_id in enumerate(alternatives.split(",")):
-        alt_data = catalog.get_exercise(alternative_id.strip())
-        if not alt_data:
-            continue
-        new_alternative = pydom["#alt-ex"][0].clone() if i > 0 else pydom["#alt-ex"][0]
+alternatives = catalog.alternatives(exercise_id)
+missing_alternatives = catalog.dangling_alternatives(exercise_id)
+if alternatives or missing_alternatives:
+    alt_template = pydom["#alt-ex"][0].clone()
+    pydom["#alt-ex"][0]._js.remove()
+    for alt_data in alternatives:
+        new_alternative = alt_template.clone()
         new_alternative._js.setAttribute("data-id", alt_data["id"])
         new_alternative._js.textContent = alt_data["name"]
         new_alternative._js.onclick = open_exercise
         pydom["#alt-ex-container"][0]._js.append(new_alternative._js)
+    # Listed ids that no longer exist (e.g. a deleted custom exercise).
+    for missing_id in missing_alternatives:
+        missing = window.document.createElement("li")
+        missing.className = "detail-not-available"
+        missing.textContent = t("alternative_missing", id=missing_id)
+        pydom["#alt-ex-container"][0]._js.append(missing)
     pydom["#alt-ex-container"][0]._js.classList.remove("d-none")
 else:
     pydom["#alt-not-available"][0]._js.classList.remove("d-none")
@@ -0,0 +1,247 @@
+import asyncio
+from collections import OrderedDict
+
+from js import IntersectionObserver, Object, window
+from pyodide.ffi import create_once_callable, create_proxy, to_js
+from pyscript import document
+
+import catalog
+import state
+from exercises import create_card_exercise
+
+# Above this many matches the grid switches to windowed rendering: only the
+# rows in or near the viewport are attached, and spacer elements stand in for
+# the rest so the scrollbar keeps its full height.
+VIRTUAL_THRESHOLD = 150
+_OVERSCAN_ROWS = 3
+_CARD_CACHE_LIMIT = 240
+_FALLBACK_ROW_HEIGHT = 360
+_RENDER_CHUNK = 24
+_IDLE_TIMEOUT_MS = 50
+
+# Rendered exercise cards keyed by exercise id, each stored with the record it
+# was built from.  render() re-shows, hides and reorders these nodes instead of
+# rebuilding them; an entry is dropped when a catalog update removes or
+# changes its record, or when it is the least recently shown card and the cache
+# is over _CARD_CACHE_LIMIT.
+_card_cache: "OrderedDict[str, tuple[dict, object]]" = OrderedDict()
+_card_cache_version: int = -1
+
+_records: list[dict] = []
+_window: tuple[int, int] = (0, 0)
+_virtual = False
+_top_spacer = None
+_bottom_spacer = None
+_observer = None
+_on_resize_proxy = None
+
+
+def _revalidate_card_cache() -> None:
+    global _card_cache_version
+    if _card_cache_version == catalog.version():
+        return
+    for exercise_id, (record, _card) in list(_card_cache.items()):
+        if catalog.get_exercise(exercise_id) != record:
+            del _card_cache[exercise_id]
+    _card_cache_version = catalog.version()
+
+
+def clear_card_cache() -> None:
+    """Drop every cached card, e.g. after a language switch changed their text."""
+    _card_cache.clear()
+
+
+def _card_for(exercise_data: dict):
+    exercise_id = str(exercise_data["id"])
+    cached = _card_cache.get(exercise_id)
+    if cached is None:
+        card = create_card_exercise(state.exercise_template, exercise_data)
+        card._js.classList.add("card-animate")
+        cached = (dict(exercise_data), card)
+        _card_cache[exercise_id] = cached
+    else:
+        _card_cache.move_to_end(exercise_id)
+    return cached[1]
+
+
+def _trim_card_cache(keep: int) -> None:
+    limit = max(_CARD_CACHE_LIMIT, keep)
+    while len(_card_cache) > limit:
+        _card_cache.popitem(last=False)
+
+
+def _make_spacer():
+    spacer = document.createElement("div")
+    spacer.className = "col-12 exercise-grid-spacer"
+    spacer.setAttribute("aria-hidden", "true")
+    return spacer
+
+
+def _layout() -> tuple[int, float]:
+    """Return (columns, row height in px) measured from an attached card."""
+    row = state.exercises_row._js
+    card = row.querySelector("[data-exercise-id]")
+    if card is None or not card.offsetWidth or not row.clientWidth:
+        return 1, _FALLBACK_ROW_HEIGHT
+    columns = max(1, round(row.clientWidth / card.offsetWidth))
+    style = window.getComputedStyle(card)
+    margin = float(str(style.marginTop).replace("px", "") or 0)
+    return columns, (card.offsetHeight + margin) or _FALLBACK_ROW_HEIGHT
+
+
+def _visible_window() -> tuple[int, int, int, float]:
+    columns, row_height = _layout()
+    top = state.exercises_row._js.getBoundingClientRect().top
+    first_row = max(0, int(-top // row_height))
+    visible_rows = int(window.innerHeight // row_height) + 1
+    start_row = max(0, first_row - _OVERSCAN_ROWS)
+    end_row = first_row + visible_rows + _OVERSCAN_ROWS
+    return start_row * columns, min(len(_records), end_row * columns), columns, row_height
+
+
+def _attach(start: int, end: int, animate: bool) -> None:
+    global _window
+    cards = []
+    for i in range(start, end):
+        card = _card_for(_records[i])
+        card._js.style.animationDelay = f"{min((i - start) * 30, 300)}ms" if animate else "0ms"
+        cards.append(card._js)
+    if _virtual:
+        state.exercises_row._js.replaceChildren(_top_spacer, *cards, _bottom_spacer)
+    else:
+        state.exercises_row._js.replaceChildren(*cards)
+    _window = (start, end)
+    _trim_card_cache(end - start)
+
+
+def _sync_window(*args) -> None:
+    if not _virtual or not _records:
+        return
+    start, end, columns, row_height = _visible_window()
+    total_rows = -(-len(_records) // columns)
+    _top_spacer.style.height = f"{(start // columns) * row_height}px"
+    _bottom_spacer.style.height = f"{max(0, total_rows - -(-end // columns)) * row_height}px"
+    if (start, end) != _window:
+        _attach(start, end, animate=False)
+
+
+def _enable_virtual_mode() -> None:
+    global _virtual, _top_spacer, _bottom_spacer, _observer, _on_resize_proxy
+    _virtual = True
+    state.exercises_row._js.classList.add("exercises-row--virtual")
+    if _observer is not None:
+        return
+    _top_spacer = _make_spacer()
+    _bottom_spacer = _make_spacer()
+    options = to_js(
+        {"rootMargin": "600px 0px", "threshold": [i / 20 for i in range(21)]},
+        dict_converter=Object.fromEntries,
+    )
+    _observer = IntersectionObserver.new(create_proxy(_sync_window), options)
+    _observer.observe(_top_spacer)
+    _observer.observe(_bottom_spacer)
+    _on_resize_proxy = create_proxy(_sync_window)
+    window.addEventListener("resize", _on_resize_proxy)
+
+
+def _disable_virtual_mode() -> None:
+    global _virtual
+    _virtual = False
+    state.exercises_row._js.classList.remove("exercises-row--virtual")
+
+
+def render(records: list[dict]) -> None:
+    """Show records in #exercises-row, windowing the grid when there are many."""
+    global _records, _window
+    _revalidate_card_cache()
+    _records = records
+    _window = (0, 0)
+    if len(records) <= VIRTUAL_THRESHOLD:
+        _disable_virtual_mode()
+        _attach(0, len(records), animate=True)
+        return
+
+    _enable_virtual_mode()
+    _top_spacer.style.height = "0px"
+    _bottom_spacer.style.height = "0px"
+    # Attach a first screenful so the layout can be measured, then size the
+    # spacers from the real card dimensions.
+    _attach(0, min(len(records), VIRTUAL_THRESHOLD // 3), animate=False)
+    _sync_window()
+
+
+async def yield_to_idle() -> None:
+    """Wait for the browser's next idle period (or the next task without requestIdleCallback)."""
+    if not hasattr(window, "requestIdleCallback"):
+        await asyncio.sleep(0)
+        return
+    future = asyncio.get_event_loop().create_future()
+
+    def _resolve(*args) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    window.requestIdleCallback(
+        create_once_callable(_resolve),
+        to_js({"timeout": _IDLE_TIMEOUT_MS}, dict_converter=Object.fromEntries),
+    )
+    await future
+
+
+def _attach_chunk(records: list[dict], start: int) -> int:
+    global _window
+    end = min(len(records), start + _RENDER_CHUNK)
+    cards = []
+    for i in range(start, end):
+        card = _card_for(records[i])
+        card._js.style.animationDelay = f"{min(i * 30, 300)}ms"
+        cards.append(card._js)
+    if start == 0:
+        state.exercises_row._js.replaceChildren(*cards)
+    else:
+        state.exercises_row._js.append(*cards)
+    _window = (0, end)
+    return end
+
+
+async def _stream(records: list[dict], start: int) -> None:
+    while start < len(records):
+        await yield_to_idle()
+        start = _attach_chunk(records, start)
+    _trim_card_cache(len(records))
+
+
+def render_progressive(records: list[dict]):
+    """Attach the first chunk (a screenful) of records now; return a coroutine streaming in the rest.
+
+    Returns None when nothing is left to stream: the records fit in one chunk
+    or the grid is windowed (render() already attaches only the visible rows).
+    The final DOM is the same as render()'s.
+    """
+    global _records, _window
+    if len(records) > VIRTUAL_THRESHOLD:
+        render(records)
+        return None
+    _revalidate_card_cache()
+    _disable_virtual_mode()
+    _records = records
+    _window = (0, 0)
+    if not records:
+        state.exercises_row._js.replaceChildren()
+        return None
+    end = _attach_chunk(records, 0)
+    if end == len(records):
+        _trim_card_cache(len(records))
+        return None
+    return _stream(records, end)
+
+
+async def render_async(records: list[dict]) -> None:
+    """Like render(), but attach cards in chunks, yielding to the browser between them.
+
+    Cancelling the awaiting task stops the render at the next chunk boundary;
+    the next render() or render_async() replaces whatever was attached.
+    """
+    rest = render_progressive(records)
+    if rest is not None:
+        await rest
@@ -1,3 +1,5 @@
+import sys
+from collections.abc import Mapping
 from typing import NotRequired, TypedDict
 
 
@@ -55,3 +57,87 @@ def normalize_exercise_records(raw_records: list[dict], *, is_custom: bool | Non
         for record in raw_records
         if isinstance(record, dict)
     ]
+
+
+LIST_FIELDS = ("category", "body_parts", "primary_muscles", "secondary_muscles", "key_cues", "alternatives")
+_RECORD_FIELDS = tuple(field for field in ExerciseRecord.__annotations__ if field != "is_custom")
+_interned_lists: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _intern_list(value: str) -> tuple[str, ...]:
+    parts = tuple(sys.intern(part) for part in value.split(",") if part) if value else ()
+    return _interned_lists.setdefault(parts, parts)
+
+
+class CompactExerciseRecord(Mapping):
+    """Slotted, read-only exercise record used inside the catalog.
+
+    The comma-list fields are held as interned tuples, so the many records
+    sharing "Strength" or ("Quadriceps", "Gluteus Maximus") share one object.
+    Indexing by field name still returns the normalized comma-joined string,
+    which keeps ``record["category"]``, ``.get()`` and ``dict(record)`` working
+    for existing callers; ``split(field)`` returns the tuple without splitting.
+    """
+
+    __slots__ = _RECORD_FIELDS + ("is_custom",)
+
+    def __init__(self, normalized: ExerciseRecord) -> None:
+        for field in _RECORD_FIELDS:
+            value = normalized.get(field, "")
+            setattr(self, field, _intern_list(value) if field in LIST_FIELDS else value)
+        self.is_custom = normalized.get("is_custom")
+        if self.equipment:
+            self.equipment = sys.intern(self.equipment)
+
+    def __getitem__(self, key: str) -> str:
+        if key in LIST_FIELDS:
+            return ",".join(getattr(self, key))
+        if key == "is_custom":
+            if self.is_custom is None:
+                raise KeyError(key)
+            return self.is_custom
+        if key in _RECORD_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from _RECORD_FIELDS
+        if self.is_custom is not None:
+            yield "is_custom"
+
+    def __len__(self) -> int:
+        return len(_RECORD_FIELDS) + (self.is_custom is not None)
+
+    def __repr__(self) -> str:
+        return f"CompactExerciseRecord({dict(self)!r})"
+
+    def split(self, field: str) -> tuple[str, ...]:
+        if field in LIST_FIELDS:
+            return getattr(self, field)
+        return tuple(item.strip() for item in self[field].split(",") if item.strip())
+
+
+def compact_exercise_records(records: list[ExerciseRecord]) -> list[CompactExerciseRecord]:
+    return [CompactExerciseRecord(record) for record in records]
+
+
+def list_field(record, field: str) -> tuple[str, ...]:
+    """Items of a comma-list field for a compact record or a plain dict."""
+    if isinstance(record, CompactExerciseRecord):
+        return record.split(field)
+    return tuple(item.strip() for item in str(record.get(field, "") or "").split(",") if item.strip())
+
+
+def key_cue_list(record) -> tuple[str, ...]:
+    """The key cues of a record, where "\\," is a comma inside one cue."""
+    cues: list[str] = []
+    pending = ""
+    for item in list_field(record, "key_cues"):
+        if item.endswith("\\"):
+            pending += item[:-1].rstrip() + ", "
+            continue
+        cues.append(pending + item)
+        pending = ""
+    if pending:
+        cues.append(pending[:-2])
+    return tuple(cues)
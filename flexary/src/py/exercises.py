@@ -2,8 +2,8 @@ from pyscript import document, window
 
 import state
 from i18n import t
+from exercise_records import list_field
 from models import category_to_badge
-from workouts import add_exercise_to_workout
 
 
 def open_exercise(event) -> None:
@@ -12,10 +12,27 @@ def open_exercise(event) -> None:
         window.open(f"detail.html?exercise_id={card.getAttribute('data-exercise-id')}", "_blank")
 
 
+# The workout stack and the custom-exercise editor are imported on first use,
+# not when the first card is built.
+def _add_exercise_to_workout(event) -> None:
+    from workouts import add_exercise_to_workout
 
-def create_card_exercise(template, exercise_data: dict):
+    add_exercise_to_workout(event)
+
+
+def _open_edit_custom_modal(event) -> None:
+    from custom_exercises import open_edit_custom_modal
+
+    open_edit_custom_modal(event)
+
+
+def _delete_custom_exercise(event) -> None:
     from custom_exercises import delete_custom_exercise
 
+    delete_custom_exercise(event)
+
+
+def create_card_exercise(template, exercise_data: dict):
     is_custom = exercise_data.get("is_custom") == "true"
 
     exercise_html = template.clone()
@@ -40,7 +57,7 @@ def create_card_exercise(template, exercise_data: dict):
     if is_custom:
         card_el._js.classList.add("exercise-card--custom")
 
-    categories = exercise_data["category"].split(",")
+    categories = list_field(exercise_data, "category") or ("",)
     body_parts_badge_element = exercise_html.find("#body-parts-badge")[0]
     category_badge_element = exercise_html.find("#category-badge")[0]
     clean_cat_badge = category_badge_element.clone()
@@ -53,7 +70,7 @@ def create_card_exercise(template, exercise_data: dict):
             body_parts_badge_element._js.before(cat_badge._js)
 
     badges_container_element = exercise_html.find("#badges")[0]
-    for i, badge in enumerate(exercise_data["body_parts"].split(",")):
+    for i, badge in enumerate(list_field(exercise_data, "body_parts") or ("",)):
         new_badge = (
             exercise_html.find("#body-parts-badge")[0].clone()
             if i > 0
@@ -83,11 +100,9 @@ def create_card_exercise(template, exercise_data: dict):
         video_link._js.setAttribute("tabindex", "-1")
 
     add_btn = exercise_html.find("#add-ex-to-workout")[0]
-    add_btn._js.onclick = add_exercise_to_workout
+    add_btn._js.onclick = _add_exercise_to_workout
 
     if is_custom:
-        from custom_exercises import open_edit_custom_modal
-
         card_body = exercise_html.find(".card-body")[0]._js
         card_actions = exercise_html.find(".card-actions")[0]._js
 
@@ -97,12 +112,12 @@ def create_card_exercise(template, exercise_data: dict):
         edit_icon = document.createElement("i")
         edit_icon.className = "bi bi-pencil card-action-icon custom-action-icon"
         edit_icon.title = t("edit_exercise")
-        edit_icon.onclick = open_edit_custom_modal
+        edit_icon.onclick = _open_edit_custom_modal
 
         delete_icon = document.createElement("i")
         delete_icon.className = "bi bi-trash card-action-icon card-action-icon--danger custom-action-icon"
         delete_icon.title = t("remove_btn")
-        delete_icon.onclick = delete_custom_exercise
+        delete_icon.onclick = _delete_custom_exercise
 
         custom_actions_row.appendChild(edit_icon)
         custom_actions_row.appendChild(delete_icon)
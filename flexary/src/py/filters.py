@@ -1,15 +1,20 @@
+import asyncio
 import json
+import time
+from collections import OrderedDict
 
 import catalog
-from js import localStorage
-from pyodide.ffi import create_proxy
+import exercise_grid
+import facets
+import proxies
+from js import Object, localStorage, window
+from pyodide.ffi import to_js
 from pyscript import document, when
 from pyweb import pydom
 
 import state
 from i18n import t
 from models import category_to_badge
-from exercises import create_card_exercise
 
 
 def _save_filters() -> None:
@@ -84,25 +89,41 @@ def build_primary_muscle_badges(counts: dict) -> str:
     return html
 
 
+# Badge clicks are handled by one delegated listener per badge row; the rows
+# themselves persist while update() rewrites their innerHTML.  Each row's
+# listener lives in its own proxy scope, remembered with the row element, and
+# is only replaced (and its proxy destroyed) when that element is replaced.
+_delegated_rows: dict[str, object] = {}
+
+
+def _delegate_clicks(selector: str, handler) -> None:
+    container = document.querySelector(selector)
+    element = _delegated_rows.get(selector)
+    if element is not None and container is not None and element.isSameNode(container):
+        return
+    owner = f"filters:{selector}"
+    if container is None:
+        proxies.release(owner)
+        _delegated_rows.pop(selector, None)
+        return
+    proxies.scope(owner).listen(container, "click", handler)
+    _delegated_rows[selector] = container
+
+
+def listener_proxy_stats() -> dict:
+    return {f"proxies_{key}": value for key, value in proxies.module_stats("filters").items()}
+
+
 def attach_category_filter_listeners() -> None:
-    container = document.getElementById("exercises-per-category-badges-row")
-    badges = container.querySelectorAll("[data-category]")
-    for i in range(badges.length):
-        badges.item(i).addEventListener("click", create_proxy(filter_by_category))
+    _delegate_clicks(state.exercises_per_category_badges_row_id, filter_by_category)
 
 
 def attach_body_part_filter_listeners() -> None:
-    container = document.getElementById("exercises-per-body-part-badges-row")
-    badges = container.querySelectorAll("[data-body-part]")
-    for i in range(badges.length):
-        badges.item(i).addEventListener("click", create_proxy(filter_by_body_part))
+    _delegate_clicks(state.exercises_per_body_part_badges_row_id, filter_by_body_part)
 
 
 def attach_primary_muscle_filter_listeners() -> None:
-    container = document.getElementById("exercises-per-primary-muscle-badges-row")
-    badges = container.querySelectorAll("[data-primary-muscle]")
-    for i in range(badges.length):
-        badges.item(i).addEventListener("click", create_proxy(filter_by_primary_muscle))
+    _delegate_clicks(state.exercises_per_primary_muscle_badges_row_id, filter_by_primary_muscle)
 
 
 def filter_by_category(event) -> None:
@@ -156,90 +177,109 @@ def update_exercise_stats(display_count: int, total: int) -> None:
     pydom["#exercise-stats"][0]._js.textContent = stats
 
 
-def update(search_str: str) -> None:
-    search_str = search_str.strip().lower()
-    search_filtered = [
-        ex for ex in catalog.all_exercises()
-        if search_str in ex["name"].lower()
-        or search_str in ex["category"].lower()
-        or search_str in ex["body_parts"].lower()
-    ]
-
-    display_data = search_filtered
-    if state.active_category_filters:
-        display_data = [
-            ex for ex in display_data
-            if any(c.strip() in state.active_category_filters for c in ex["category"].split(","))
-        ]
-    if state.active_body_part_filters:
-        display_data = [
-            ex for ex in display_data
-            if any(bp.strip() in state.active_body_part_filters for bp in ex["body_parts"].split(","))
-        ]
-    if state.active_primary_muscle_filters:
-        display_data = [
-            ex for ex in display_data
-            if any(m.strip() in state.active_primary_muscle_filters for m in ex["primary_muscles"].split(","))
-        ]
+def _active_filters() -> dict[str, set[str]]:
+    return {
+        "category": state.active_category_filters,
+        "body_parts": state.active_body_part_filters,
+        "primary_muscles": state.active_primary_muscle_filters,
+    }
+
+
+# Recent query results keyed by (normalized search, selected facet values).
+# Each entry holds the displayed exercise ids, the facet counts and the search
+# match total; the whole cache is dropped when catalog.version() changes.
+_QUERY_CACHE_SIZE = 64
+_query_cache: "OrderedDict[tuple, tuple[list[str], facets.FacetResult, int]]" = OrderedDict()
+_query_cache_version: int = -1
+_query_cache_hits: int = 0
+_query_cache_misses: int = 0
+
+
+def _query_key(search_str: str) -> tuple:
+    return (" ".join(search_str.lower().split()),) + tuple(
+        frozenset(values) for values in _active_filters().values()
+    )
+
+
+def _query(search_str: str) -> tuple[list, facets.FacetResult, int]:
+    global _query_cache_version, _query_cache_hits, _query_cache_misses
+    if _query_cache_version != catalog.version():
+        _query_cache.clear()
+        _query_cache_version = catalog.version()
+
+    key = _query_key(search_str)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        _query_cache.move_to_end(key)
+        _query_cache_hits += 1
+        display_ids, result, total = cached
+        return [catalog.get_exercise(exercise_id) for exercise_id in display_ids], result, total
+
+    _query_cache_misses += 1
+    ranks = catalog.search(key[0])
+    search_mask = catalog.mask_of(ranks)
+    result = facets.compute(
+        search_mask,
+        catalog.facet_indexes(),
+        {field: catalog.selection_mask(field, values) for field, values in _active_filters().items()},
+    )
+    display_data = catalog.exercises_in(result.display_mask, ranks)
+    total = search_mask.bit_count()
+    _query_cache[key] = ([str(ex["id"]) for ex in display_data], result, total)
+    if len(_query_cache) > _QUERY_CACHE_SIZE:
+        _query_cache.popitem(last=False)
+    return display_data, result, total
+
 
-    state.exercises_row._js.innerHTML = ""
+def query_cache_stats() -> dict:
+    return {
+        "cache_hits": _query_cache_hits,
+        "cache_misses": _query_cache_misses,
+        "cache_size": len(_query_cache),
+    }
+
+
+def _render_facets(display_data: list, result: facets.FacetResult, total: int) -> None:
     empty_state = pydom["#empty-state"][0]
     if display_data:
         empty_state._js.classList.add("d-none")
-        for i, exercise_data in enumerate(display_data):
-            card = create_card_exercise(state.exercise_template, exercise_data)
-            card._js.classList.add("card-animate")
-            card._js.style.animationDelay = f"{min(i * 30, 300)}ms"
-            state.exercises_row.append(card)
     else:
         empty_state._js.classList.remove("d-none")
 
-    bp_pm_filtered = [
-        ex for ex in search_filtered
-        if (not state.active_body_part_filters or any(bp.strip() in state.active_body_part_filters for bp in ex["body_parts"].split(",")))
-        and (not state.active_primary_muscle_filters or any(m.strip() in state.active_primary_muscle_filters for m in ex["primary_muscles"].split(",")))
-    ]
-    cat_counts: dict = {}
-    for ex in bp_pm_filtered:
-        for c in ex["category"].split(","):
-            c = c.strip()
-            if c:
-                cat_counts[c] = cat_counts.get(c, 0) + 1
-
-    cat_pm_filtered = [
-        ex for ex in search_filtered
-        if (not state.active_category_filters or any(c.strip() in state.active_category_filters for c in ex["category"].split(",")))
-        and (not state.active_primary_muscle_filters or any(m.strip() in state.active_primary_muscle_filters for m in ex["primary_muscles"].split(",")))
-    ]
-    bp_counts: dict = {}
-    for ex in cat_pm_filtered:
-        for bp in ex["body_parts"].split(","):
-            bp = bp.strip()
-            if bp:
-                bp_counts[bp] = bp_counts.get(bp, 0) + 1
-
-    cat_bp_filtered = [
-        ex for ex in search_filtered
-        if (not state.active_category_filters or any(c.strip() in state.active_category_filters for c in ex["category"].split(",")))
-        and (not state.active_body_part_filters or any(bp.strip() in state.active_body_part_filters for bp in ex["body_parts"].split(",")))
-    ]
-    pm_counts: dict = {}
-    for ex in cat_bp_filtered:
-        for m in ex["primary_muscles"].split(","):
-            m = m.strip()
-            if m:
-                pm_counts[m] = pm_counts.get(m, 0) + 1
-
-    pydom[state.exercises_per_category_badges_row_id][0]._js.innerHTML = build_category_badges(cat_counts)
+    pydom[state.exercises_per_category_badges_row_id][0]._js.innerHTML = build_category_badges(result.counts["category"])
     attach_category_filter_listeners()
-    pydom[state.exercises_per_body_part_badges_row_id][0]._js.innerHTML = build_body_part_badges(bp_counts)
+    pydom[state.exercises_per_body_part_badges_row_id][0]._js.innerHTML = build_body_part_badges(result.counts["body_parts"])
     attach_body_part_filter_listeners()
-    pydom[state.exercises_per_primary_muscle_badges_row_id][0]._js.innerHTML = build_primary_muscle_badges(pm_counts)
+    pydom[state.exercises_per_primary_muscle_badges_row_id][0]._js.innerHTML = build_primary_muscle_badges(result.counts["primary_muscles"])
     attach_primary_muscle_filter_listeners()
-    update_exercise_stats(len(display_data), len(search_filtered))
+    update_exercise_stats(len(display_data), total)
     _update_filter_badge()
 
 
+def update(search_str: str) -> None:
+    _cancel_pending_search()
+    display_data, result, total = _query(search_str)
+    exercise_grid.render(display_data)
+    _render_facets(display_data, result, total)
+    _publish_stats()
+
+
+def update_progressive(search_str: str) -> None:
+    """Like update(), but only the first screenful of cards is attached before returning.
+
+    The remaining cards stream in at idle time as the pending search task, so
+    a keystroke or another update() cancels them like any other search.
+    """
+    global _search_task
+    _cancel_pending_search()
+    display_data, result, total = _query(search_str)
+    rest = exercise_grid.render_progressive(display_data)
+    _render_facets(display_data, result, total)
+    if rest is not None:
+        _search_task = asyncio.ensure_future(rest)
+    _publish_stats()
+
+
 def clear_filters(event) -> None:
     state.active_category_filters.clear()
     state.active_body_part_filters.clear()
@@ -250,6 +290,60 @@ def clear_filters(event) -> None:
     update("")
 
 
+# Search-box input is coalesced: each keystroke restarts a short debounce, and
+# a newer keystroke cancels the previous task even if it is already rendering.
+_SEARCH_DEBOUNCE_MS = 120
+_SEARCH_LATENCY_SAMPLES = 50
+_search_task: asyncio.Task | None = None
+_search_latencies_ms: list[float] = []
+
+
+def _cancel_pending_search() -> None:
+    global _search_task
+    if _search_task is not None and not _search_task.done():
+        _search_task.cancel()
+    _search_task = None
+
+
+def _record_search_latency(started_at: float) -> None:
+    latency_ms = (time.perf_counter() - started_at) * 1000
+    _search_latencies_ms.append(latency_ms)
+    del _search_latencies_ms[:-_SEARCH_LATENCY_SAMPLES]
+    _publish_stats()
+
+
+def _publish_stats() -> None:
+    """Expose search latency, query-cache and listener-proxy counters as window.flexarySearchStats."""
+    try:
+        window.flexarySearchStats = to_js(
+            {**search_stats(), **query_cache_stats(), **listener_proxy_stats()}, dict_converter=Object.fromEntries
+        )
+    except Exception:
+        pass
+
+
+def search_stats() -> dict:
+    """Latency from the last keystroke to the final rendered result, in ms."""
+    samples = sorted(_search_latencies_ms)
+    return {
+        "last_ms": round(_search_latencies_ms[-1], 1) if samples else None,
+        "median_ms": round(samples[len(samples) // 2], 1) if samples else None,
+        "max_ms": round(samples[-1], 1) if samples else None,
+        "samples": len(samples),
+    }
+
+
+async def _run_search(search_str: str, started_at: float) -> None:
+    await asyncio.sleep(_SEARCH_DEBOUNCE_MS / 1000)
+    display_data, result, total = _query(search_str)
+    _render_facets(display_data, result, total)
+    await exercise_grid.render_async(display_data)
+    _record_search_latency(started_at)
+
+
 @when("input", "#search-input")
 def handle_search_input(event):
-    update(event.target.value)
+    global _search_task
+    started_at = time.perf_counter()
+    _cancel_pending_search()
+    _search_task = asyncio.ensure_future(_run_search(event.target.value, started_at))
@@ -4,8 +4,11 @@ from js import localStorage, window, Object
 from pyodide.ffi import to_js
 from pyscript import document
 
+import perf
+
 SUPPORTED = frozenset(["en", "es", "de", "ca"])
 LS_LANG_KEY = "flexary_lang"
+LOCALES_URL = "./locales"
 
 
 def _detect_lang() -> str:
@@ -18,17 +21,48 @@ def _detect_lang() -> str:
 
 lang: str = _detect_lang()
 
-try:
-    with open(f"{lang}.json") as _f:
-        _msgs: dict = json.load(_f)
-except Exception:
-    _msgs = {}
 
-try:
-    window.flexaryI18n = to_js(_msgs, dict_converter=Object.fromEntries)
-    window.flexaryLang = lang
-except Exception:
-    pass
+def _load_messages(lang: str) -> dict:
+    try:
+        with open(f"{lang}.json") as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+    except OSError:
+        pass
+    # The bundled config does not ship every locale: fetch only the active one.
+    try:
+        from pyodide.http import open_url
+
+        return json.loads(open_url(f"{LOCALES_URL}/{lang}.json").getvalue())
+    except Exception:
+        return {}
+
+
+# Messages per locale, so switching back and forth loads each locale once.
+_messages_by_lang: dict[str, dict] = {}
+
+
+def _messages(lang: str) -> dict:
+    msgs = _messages_by_lang.get(lang)
+    if msgs is None:
+        msgs = _messages_by_lang[lang] = _load_messages(lang)
+    return msgs
+
+
+with perf.span("i18n load"):
+    _msgs: dict = _messages(lang)
+
+
+def _publish() -> None:
+    try:
+        window.flexaryI18n = to_js(_msgs, dict_converter=Object.fromEntries)
+        window.flexaryLang = lang
+    except Exception:
+        pass
+
+
+_publish()
 
 
 def t(key: str, **kwargs) -> str:
@@ -42,45 +76,88 @@ def t(key: str, **kwargs) -> str:
     return msg
 
 
-def _translate_root(root) -> None:
-    """Apply all data-i18n* translations to a given DOM root or DocumentFragment."""
-    els = root.querySelectorAll("[data-i18n]")
+# data-i18n* attribute -> how its message is applied to the element.
+_I18N_ATTRIBUTES = ("data-i18n", "data-i18n-html", "data-i18n-ph", "data-i18n-title")
+_I18N_SELECTOR = ",".join(f"[{attribute}]" for attribute in _I18N_ATTRIBUTES)
+
+# (element, attribute, key) for every translated node in the document, so a
+# language switch re-translates exactly these instead of querying again.
+# Template contents are kept separately: they are never connected, so they
+# are not pruned.  Markup built after boot is cloned from those templates
+# and rebuilt by the on_change() callbacks, so it is never bound here.
+_bindings: list[tuple[object, str, str]] = []
+_template_bindings: list[tuple[object, str, str]] = []
+_listeners: list = []
+
+
+def _apply(el, attribute: str, key: str) -> None:
+    val = _msgs.get(key)
+    if val is None:
+        return
+    if attribute == "data-i18n":
+        el.textContent = val
+    elif attribute == "data-i18n-html":
+        el.innerHTML = val
+    elif attribute == "data-i18n-ph":
+        el.placeholder = val
+    else:
+        el.setAttribute("title", val)
+
+
+def _translate_root(root, bindings: list | None = None) -> None:
+    """Apply all data-i18n* translations under a DOM root or DocumentFragment in one pass."""
+    els = root.querySelectorAll(_I18N_SELECTOR)
     for i in range(els.length):
         el = els.item(i)
-        val = _msgs.get(str(el.getAttribute("data-i18n")))
-        if val is not None:
-            el.textContent = val
-
-    els = root.querySelectorAll("[data-i18n-html]")
-    for i in range(els.length):
-        el = els.item(i)
-        val = _msgs.get(str(el.getAttribute("data-i18n-html")))
-        if val is not None:
-            el.innerHTML = val
-
-    els = root.querySelectorAll("[data-i18n-ph]")
-    for i in range(els.length):
-        el = els.item(i)
-        val = _msgs.get(str(el.getAttribute("data-i18n-ph")))
-        if val is not None:
-            el.placeholder = val
-
-    els = root.querySelectorAll("[data-i18n-title]")
-    for i in range(els.length):
-        el = els.item(i)
-        val = _msgs.get(str(el.getAttribute("data-i18n-title")))
-        if val is not None:
-            el.setAttribute("title", val)
+        for attribute in _I18N_ATTRIBUTES:
+            key = el.getAttribute(attribute)
+            if key is None:
+                continue
+            key = str(key)
+            _apply(el, attribute, key)
+            if bindings is not None:
+                bindings.append((el, attribute, key))
 
 
 def apply_html_translations() -> None:
     """Apply locale to all [data-i18n*] elements in the active DOM and templates."""
-    _translate_root(document)
+    _bindings.clear()
+    _template_bindings.clear()
+    _translate_root(document, _bindings)
 
     templates = document.querySelectorAll("template")
     for i in range(templates.length):
-        _translate_root(templates.item(i).content)
+        _translate_root(templates.item(i).content, _template_bindings)
 
     sel = document.getElementById("lang-select")
     if sel:
         sel.value = lang
+
+
+def on_change(callback) -> None:
+    """Call callback() after every set_language(), to re-render text built with t()."""
+    _listeners.append(callback)
+
+
+def set_language(new_lang: str) -> bool:
+    """Switch the page to new_lang in place; return False when there is nothing to switch."""
+    global lang, _msgs
+    new_lang = str(new_lang)
+    if new_lang not in SUPPORTED or new_lang == lang:
+        return False
+    localStorage.setItem(LS_LANG_KEY, new_lang)
+    with perf.span("i18n switch"):
+        lang = new_lang
+        _msgs = _messages(lang)
+        _publish()
+        document.documentElement.lang = lang
+        _bindings[:] = [binding for binding in _bindings if binding[0].isConnected]
+        for el, attribute, key in _bindings + _template_bindings:
+            _apply(el, attribute, key)
+        for callback in _listeners:
+            callback()
+    try:
+        window.dispatchEvent(window.CustomEvent.new("flexary-language-change"))
+    except Exception:
+        pass
+    return True
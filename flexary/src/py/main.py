@@ -1,6 +1,17 @@
 import asyncio
 import importlib
 import json
+import sys
+
+import bundle
+
+bundle.mount()
+
+import perf
+
+if bundle.mounted is not None:
+    perf.record("bundle mount", *bundle.mounted)
+_imports_started_at = perf.now()
 
 from pyodide.ffi import create_proxy
 from pyodide.ffi.wrappers import add_event_listener
@@ -10,37 +21,52 @@ from pyweb import pydom
 import catalog
 from common import copyright, current_version
 from js import window
-from i18n import apply_html_translations
+from i18n import apply_html_translations, on_change as on_language_change, set_language
 import state
 from auth import (
     close_auth_modal,
     initialize_auth_ui,
     open_auth_modal,
     open_contact,
+    refresh_auth_ui,
     send_magic_link,
     sign_out,
     toggle_user_menu,
 )
 from filters import (
     clear_filters,
-    update as update_filters,
+    update_progressive as update_filters_progressive,
 )
-from ics import download_ics
-from workouts import add_workout, hide_sidebar, render_workouts, remove_workouts, update_workout_badge
-from custom_exercises import open_add_custom_modal
-from workout_export import download_workouts_json, save_workouts
+from exercise_grid import clear_card_cache, yield_to_idle
 
-_pdf_module = None
+perf.record("imports", _imports_started_at, perf.now())
+
+# Modules only needed once the visitor works with workouts, custom exercises
+# or exports.  They are imported on first use (or in an idle prefetch after
+# first paint) rather than on the boot path.
+_lazy_modules: dict = {}
+_WORKOUT_STACK = ("workouts", "ics", "workout_export", "custom_exercises")
+
+
+def _lazy(name: str):
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = _lazy_modules[name] = importlib.import_module(name)
+    return module
 
 
 def _pdf():
-    global _pdf_module
-    if _pdf_module is None:
-        _pdf_module = importlib.import_module("pdf")
-    return _pdf_module
+    return _lazy("pdf")
+
+
+def _warm_pdf() -> None:
+    # ui.js owns the PDF worker; warming it again once it is started is a no-op.
+    if hasattr(window, "flexaryWarmPdf"):
+        window.flexaryWarmPdf()
 
 
 def open_pdf_modal(*args) -> None:
+    _warm_pdf()
     _pdf().download_file(*args)
 
 
@@ -56,19 +82,54 @@ def clear_logo(*args) -> None:
     _pdf().clear_logo(*args)
 
 
+def add_workout(*args) -> None:
+    _lazy("workouts").add_workout(*args)
+    _warm_pdf()
+
+
+def remove_workouts(*args) -> None:
+    _lazy("workouts").remove_workouts(*args)
+
+
+def open_add_custom_modal(*args) -> None:
+    _lazy("custom_exercises").open_add_custom_modal(*args)
+
+
+def download_ics(*args) -> None:
+    _lazy("ics").download_ics(*args)
+
+
+async def save_workouts(*args) -> None:
+    await _lazy("workout_export").save_workouts(*args)
+
+
+def _load_workout_stack(*args) -> None:
+    for name in _WORKOUT_STACK:
+        _lazy(name)
+
+
 def show_info(event) -> None:
     document.getElementById("info-modal").showModal()
 
 
-apply_html_translations()
+with perf.span("translate"):
+    apply_html_translations()
 
-catalog.initialize(state.custom_exercises)
+with perf.span("catalog"):
+    catalog.initialize(state.custom_exercises)
 
-# Expose the full catalog as JSON so the PDF Web Worker can look up exercises
-# without needing its own copy of the CSV.
-window.flexaryCatalogJson = json.dumps(
-    {ex["id"]: dict(ex) for ex in catalog.all_exercises()}
-)
+# The PDF Web Worker only needs a couple of fields of the exercises being
+# printed.  ui.js asks for them when a PDF is requested, so nothing is
+# serialised at startup and the postMessage payload stays small.
+_PDF_CATALOG_FIELDS = ("category", "yt_video_id")
+
+
+def _catalog_for_pdf() -> str:
+    exercise_ids = {str(ex.id) for workout in state.workouts for ex in workout.exercises}
+    return json.dumps(catalog.transfer_subset(sorted(exercise_ids), _PDF_CATALOG_FIELDS), ensure_ascii=False)
+
+
+window.flexaryCatalogForPdf = create_proxy(_catalog_for_pdf)
 
 # Expose a helper the JS PDF handler calls to flush pending DOM inputs (workout
 # name / date fields) into localStorage before serialising workout data.
@@ -77,7 +138,10 @@ def _flush_for_pdf():
 
 window.flexaryFlushForPdf = create_proxy(_flush_for_pdf)
 
-update_filters("")
+# Only the first screenful of cards is rendered on the boot path; the rest
+# streams in at idle time while _bootstrap() initialises auth.
+with perf.span("first render"):
+    update_filters_progressive("")
 
 pydom["#skeleton-row"][0]._js.classList.add("d-none")
 pydom["#filter-row"][0]._js.classList.remove("d-none")
@@ -97,23 +161,45 @@ add_event_listener(document.getElementById("save-workouts"), "click", save_worko
 add_event_listener(document.getElementById("pdf-logo-input"), "change", on_logo_file_change)
 add_event_listener(document.getElementById("pdf-logo-clear"), "click", clear_logo)
 
+# Opening the sidebar is the first sign the visitor is about to edit workouts.
+document.getElementById("toggle-workout-sidebar").addEventListener("click", create_proxy(_load_workout_stack))
+
+
 def _refresh_workouts_ui() -> None:
     if state.workouts:
-        render_workouts(state.workouts)
-        update_workout_badge()
-    else:
-        hide_sidebar()
+        workouts = _lazy("workouts")
+        workouts.render_workouts(state.workouts)
+        workouts.update_workout_badge()
+    elif "workouts" in sys.modules:
+        # Imported by _lazy() or directly (e.g. exercises._add_exercise_to_workout).
+        _lazy("workouts").hide_sidebar()
+    # Otherwise the sidebar is still in its initial, empty and hidden state.
+
+
+def _on_language_change() -> None:
+    # i18n re-translated the static markup; re-render what was built with t().
+    clear_card_cache()
+    update_filters_progressive(str(document.getElementById("search-input").value or ""))
+    _refresh_workouts_ui()
+    asyncio.ensure_future(refresh_auth_ui())
+
+
+on_language_change(_on_language_change)
+# ui.js switches the language through this instead of reloading the page.
+window.flexarySetLanguage = create_proxy(set_language)
 
 
 def _on_auth_change(event) -> None:
-    if not state.is_authenticated() and state.strip_custom_video_overrides():
+    # Custom videos are masked while signed out: signing in or out re-renders them.
+    if state.has_custom_videos():
         _refresh_workouts_ui()
 
 
 async def _bootstrap() -> None:
-    await initialize_auth_ui()
-    if not state.is_authenticated():
-        state.strip_custom_video_overrides()
+    with perf.span("auth"):
+        await initialize_auth_ui()
+    # First access to state.workouts: the saved plan is parsed here, after the
+    # grid has painted.
     _refresh_workouts_ui()
     window.addEventListener("flexary-auth-change", create_proxy(_on_auth_change))
     document.getElementById("loading").close()
@@ -121,6 +207,13 @@ async def _bootstrap() -> None:
     # Reveal footer only after the container is visible so the footer is already
     # off-screen (below the fold) when it appears — no layout shift.
     document.getElementById("footer").classList.remove("d-none")
+    perf.finish_boot()
+    await yield_to_idle()
+    _load_workout_stack()
+    # The PDF runtime is the heaviest download of all: only fetch it ahead of
+    # time for visitors who already have something to print.
+    if state.workouts:
+        _warm_pdf()
 
 
 asyncio.ensure_future(_bootstrap())
@@ -11,6 +11,7 @@ from pyodide_js import loadPackage
 from pyodide.http import pyfetch
 
 import state
+from exercise_records import list_field
 from i18n import t
 from models import category_to_rgb, workouts_from_json, _reps_display, _time_display, _dist_display
 
@@ -58,16 +59,17 @@ async def _ensure_pdf_runtime() -> None:
     await _pdf_runtime_loading
     _pdf_runtime_ready = True
 
+async def _fetch_pdf_asset(target: Path, source: str) -> None:
+    response = await pyfetch(source)
+    target.write_bytes(await response.bytes())
+
 async def _ensure_pdf_assets() -> None:
     _PDF_ASSET_DIR.mkdir(exist_ok=True)
-
-    for filename, source in {**_PDF_FONT_SOURCES, **_PDF_IMAGE_SOURCES}.items():
-        target = _PDF_ASSET_DIR / filename
-        if target.exists():
-            continue
-        response = await pyfetch(source)
-        data = await response.bytes()
-        target.write_bytes(data)
+    await asyncio.gather(*(
+        _fetch_pdf_asset(_PDF_ASSET_DIR / filename, source)
+        for filename, source in {**_PDF_FONT_SOURCES, **_PDF_IMAGE_SOURCES}.items()
+        if not (_PDF_ASSET_DIR / filename).exists()
+    ))
 
 def _hex_to_rgb(hex_color: str) -> tuple:
     h = hex_color.lstrip("#")
@@ -397,7 +399,7 @@ def create_pdf(black_and_white: bool = False, custom_logo_bytes: bytes | None =
                     sets = int(exercise.sets)
                 except Exception:
                     sets = 1
-                categories = [c.strip() for c in ex_data["category"].split(",")] if ex_data else []
+                categories = list(list_field(ex_data, "category")) if ex_data else []
 
                 badge_h = 4
                 badge_pad_v = 1.5
@@ -438,7 +440,7 @@ def create_pdf(black_and_white: bool = False, custom_logo_bytes: bytes | None =
                 else:
                     notes_h = 0
                 is_time_based = exercise.time and not exercise.reps
-                is_mobility = ex_data and "mobility" in [c.strip().lower() for c in ex_data["category"].split(",")]
+                is_mobility = ex_data and "mobility" in [c.lower() for c in categories]
                 has_rest = bool(exercise.rest_between_sets) and not exercise.superset_id
                 if has_rest:
                     _m_r, _s_r = divmod(exercise.rest_between_sets, 60)
@@ -656,8 +658,7 @@ async def _perform_download(black_and_white: bool = False) -> None:
     icon.className = "bi bi-arrow-repeat spin"
     btn.disabled = True
     try:
-        await _ensure_pdf_runtime()
-        await _ensure_pdf_assets()
+        await asyncio.gather(_ensure_pdf_runtime(), _ensure_pdf_assets())
         pdf = create_pdf(black_and_white=black_and_white, custom_logo_bytes=custom_logo_bytes, custom_site_url=custom_site_url, custom_border_color=custom_border_color)
         encoded_data = pdf.output()
         my_stream = io.BytesIO(encoded_data)
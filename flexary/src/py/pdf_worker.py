@@ -15,6 +15,7 @@ following minimal differences:
   • Returns `bytes` instead of triggering a browser download.
 """
 
+import asyncio
 import io
 import json
 import math
@@ -52,22 +53,32 @@ def set_app_root(url: str) -> None:
 # Asset fetching (fonts + logo)
 # ---------------------------------------------------------------------------
 
+async def _fetch_asset(target: Path, url: str) -> None:
+    response = await pyfetch(url)
+    target.write_bytes(await response.bytes())
+
+
 async def _ensure_assets() -> None:
     global _assets_fetched
     if _assets_fetched:
         return
     _PDF_ASSET_DIR.mkdir(exist_ok=True)
-    for filename, rel_path in {**_PDF_FONT_SOURCES, **_PDF_IMAGE_SOURCES}.items():
-        target = _PDF_ASSET_DIR / filename
-        if target.exists():
-            continue
-        url = _APP_ROOT + rel_path
-        response = await pyfetch(url)
-        data = await response.bytes()
-        target.write_bytes(data)
+    # All fonts and the logo are fetched at once rather than one after another.
+    await asyncio.gather(*(
+        _fetch_asset(_PDF_ASSET_DIR / filename, _APP_ROOT + rel_path)
+        for filename, rel_path in {**_PDF_FONT_SOURCES, **_PDF_IMAGE_SOURCES}.items()
+        if not (_PDF_ASSET_DIR / filename).exists()
+    ))
     _assets_fetched = True
 
 
+async def warm_up() -> None:
+    """Fetch the assets and import the PDF libraries, so the first generate_pdf_bytes() only renders."""
+    await _ensure_assets()
+    import fpdf
+    import qrcode
+
+
 # ---------------------------------------------------------------------------
 # Helpers (mirrors of the equivalents in models.py / pdf.py)
 # ---------------------------------------------------------------------------
@@ -111,6 +122,20 @@ def _dist_display(raw: str, sets: int = 0) -> str:
     return "/".join(values)
 
 
+_CATALOG_TRANSFER_VERSION = 1
+
+
+def _decode_catalog(catalog_json: str) -> dict:
+    """Expand the main thread's columnar catalog subset into {id: {field: value}}."""
+    payload = json.loads(catalog_json) if catalog_json else {}
+    if not payload:
+        return {}
+    if payload.get("version") != _CATALOG_TRANSFER_VERSION:
+        raise ValueError(f"unsupported catalog transfer version: {payload.get('version')!r}")
+    fields = payload["fields"]
+    return {exercise_id: dict(zip(fields, row)) for exercise_id, row in payload["rows"].items()}
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -140,7 +165,7 @@ async def generate_pdf_bytes(
 
     locale_dict: dict = json.loads(locale_json) if locale_json else {}
     t = _make_t(locale_dict)
-    catalog_dict: dict = json.loads(catalog_json) if catalog_json else {}
+    catalog_dict: dict = _decode_catalog(catalog_json)
     workouts = workouts_from_json(workouts_json)
 
     category_to_rgb = {
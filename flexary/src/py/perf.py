@@ -0,0 +1,140 @@
+"""Startup phase timings, exposed as window.flexaryPerf.
+
+Each phase of the boot is recorded as a span:
+
+    with perf.span("catalog"):
+        catalog.initialize(state.custom_exercises)
+
+and mirrored as a performance.measure("flexary:<name>") entry, so the phases
+also line up with the DevTools performance panel.  Times are ms since
+navigation start.  Everything before the first Python line runs (fetching
+PyScript, Pyodide and the [files] of pyscript.toml) is reconstructed from
+resource timing when the boot finishes.
+
+finish_boot() closes the "boot" span and keeps the last _BOOT_HISTORY boots
+in localStorage, so field timings can be compared across visits.
+"""
+
+import datetime
+import json
+from contextlib import contextmanager
+
+from js import Object, localStorage, performance, window
+from pyodide.ffi import to_js
+
+LS_PERF_KEY = "flexary_perf_boots"
+_BOOT_HISTORY = 10
+
+# Resource URLs belonging to each pre-Python phase.
+_RUNTIME_RESOURCES = ("pyscript.net", "pyodide")
+_FILE_RESOURCES = (".py", ".json", ".csv", "pyscript.toml")
+
+
+def now() -> float:
+    try:
+        return float(performance.now())
+    except Exception:
+        return 0.0
+
+
+_python_started_at = now()
+_spans: list[dict] = []
+_boot_ms: float | None = None
+_boots: list[dict] | None = None
+
+
+def record(name: str, start: float, end: float) -> None:
+    _spans.append({"name": name, "start": round(start, 1), "duration": round(end - start, 1)})
+    try:
+        performance.measure(
+            f"flexary:{name}", to_js({"start": start, "end": end}, dict_converter=Object.fromEntries)
+        )
+    except Exception:
+        pass
+    _publish()
+
+
+@contextmanager
+def span(name: str):
+    started_at = now()
+    try:
+        yield
+    finally:
+        record(name, started_at, now())
+
+
+def _resource_span(patterns: tuple[str, ...]) -> tuple[float, float] | None:
+    try:
+        entries = performance.getEntriesByType("resource")
+    except Exception:
+        return None
+    start = end = None
+    for i in range(entries.length):
+        entry = entries[i]
+        if float(entry.startTime) > _python_started_at:
+            continue
+        if not any(pattern in str(entry.name) for pattern in patterns):
+            continue
+        start = float(entry.startTime) if start is None else min(start, float(entry.startTime))
+        end = float(entry.responseEnd) if end is None else max(end, float(entry.responseEnd))
+    return (start, end) if start is not None else None
+
+
+def _record_pre_python() -> None:
+    runtime = _resource_span(_RUNTIME_RESOURCES)
+    if runtime is not None:
+        record("runtime fetch", *runtime)
+    files = _resource_span(_FILE_RESOURCES)
+    if files is not None:
+        record("files fetch", *files)
+    record("python start", 0.0, _python_started_at)
+
+
+def load_boots() -> list[dict]:
+    """Boots persisted by previous visits (plus this one once it has finished), oldest first."""
+    global _boots
+    if _boots is None:
+        _boots = []
+        raw = localStorage.getItem(LS_PERF_KEY)
+        try:
+            stored = json.loads(raw) if raw else []
+        except Exception:
+            stored = []
+        if isinstance(stored, list):
+            _boots = stored[-_BOOT_HISTORY:] if _BOOT_HISTORY > 0 else []
+    return _boots
+
+
+def finish_boot() -> None:
+    """Close the boot (navigation start to now) and persist it with the previous ones."""
+    global _boot_ms
+    if _boot_ms is not None:
+        return
+    _record_pre_python()
+    _boot_ms = now()
+    record("boot", 0.0, _boot_ms)
+    if _BOOT_HISTORY <= 0:
+        return
+    boots = load_boots()
+    boots.append({
+        "at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "boot": round(_boot_ms, 1),
+        "phases": {entry["name"]: entry["duration"] for entry in _spans},
+    })
+    del boots[:-_BOOT_HISTORY]
+    try:
+        localStorage.setItem(LS_PERF_KEY, json.dumps(boots))
+    except Exception:
+        pass
+    _publish()
+
+
+def stats() -> dict:
+    return {"boot": round(_boot_ms, 1) if _boot_ms is not None else None, "spans": list(_spans)}
+
+
+def _publish() -> None:
+    try:
+        window.flexaryPerf = to_js({**stats(), "boots": load_boots()}, dict_converter=Object.fromEntries)
+    except Exception:
+        pass
@@ -0,0 +1,165 @@
+"""Ownership of the pyodide proxies the app hands to the DOM.
+
+create_proxy() pins its Python callable until destroy() is called, and a
+listener attached to a node that is later thrown away keeps its proxy alive
+forever.  Every re-rendered part of the UI therefore takes its proxies from a
+ProxyScope:
+
+    owner = proxies.scope("workout_rendering")
+    owner.listen(button, "click", on_click)
+
+Opening a scope for an owner releases that owner's previous scope, so a
+re-render destroys the proxies of the render it replaces.  A scope opened with
+a root element (a modal overlay) is also released as soon as that root is
+removed from the document.
+
+Live proxy counts per module are published as window.flexaryProxyStats.
+"""
+
+import asyncio
+
+from js import MutationObserver, Object, document, window
+from pyodide.ffi import create_proxy, to_js
+
+
+class ProxyScope:
+    __slots__ = ("owner", "root", "_listeners", "_proxies", "released")
+
+    def __init__(self, owner: str, root=None) -> None:
+        self.owner = owner
+        self.root = root
+        self._listeners: list[tuple[object, str, object]] = []
+        self._proxies: list[object] = []
+        self.released = False
+
+    @property
+    def module(self) -> str:
+        return self.owner.split(":", 1)[0]
+
+    def proxy(self, handler):
+        """create_proxy(handler), destroyed with this scope."""
+        proxy = create_proxy(handler)
+        self._proxies.append(proxy)
+        _count(self.module, created=1)
+        return proxy
+
+    def listen(self, element, event: str, handler):
+        """element.addEventListener(event, handler); removed and destroyed with this scope."""
+        proxy = self.proxy(handler)
+        element.addEventListener(event, proxy)
+        self._listeners.append((element, event, proxy))
+        return proxy
+
+    def release(self) -> None:
+        if self.released:
+            return
+        self.released = True
+        for element, event, proxy in self._listeners:
+            try:
+                element.removeEventListener(event, proxy)
+            except Exception:
+                pass
+        # Listeners are detached right away, but the proxies are destroyed on
+        # the next turn of the event loop: release() is often reached from a
+        # handler (a click that re-renders) whose own proxy is still running.
+        _call_soon(_destroy_all, self._proxies)
+        _count(self.module, destroyed=len(self._proxies))
+        self._listeners.clear()
+        self._proxies = []
+        if _scopes.get(self.owner) is self:
+            del _scopes[self.owner]
+
+
+def _destroy_all(proxies: list) -> None:
+    for proxy in proxies:
+        try:
+            proxy.destroy()
+        except Exception:
+            pass
+
+
+def _call_soon(callback, *args) -> None:
+    try:
+        asyncio.get_event_loop().call_soon(callback, *args)
+    except RuntimeError:
+        callback(*args)
+
+
+_scopes: dict[str, ProxyScope] = {}
+_created: dict[str, int] = {}
+_destroyed: dict[str, int] = {}
+_observer = None
+_publish_pending = False
+
+
+def scope(owner: str, root=None) -> ProxyScope:
+    """Open a fresh scope for owner ("module" or "module:part"), releasing its previous one."""
+    previous = _scopes.get(owner)
+    if previous is not None:
+        previous.release()
+    new_scope = ProxyScope(owner, root)
+    _scopes[owner] = new_scope
+    if root is not None:
+        _observe_document()
+    return new_scope
+
+
+def release(owner: str) -> None:
+    current = _scopes.get(owner)
+    if current is not None:
+        current.release()
+
+
+def _release_detached(*args) -> None:
+    for current in list(_scopes.values()):
+        if current.root is not None and not current.root.isConnected:
+            current.release()
+
+
+def _observe_document() -> None:
+    # Overlays are appended to and removed from <body> itself, so watching its
+    # direct children is enough to notice when a rooted scope's root goes away.
+    global _observer
+    if _observer is not None:
+        return
+    _observer = MutationObserver.new(create_proxy(_release_detached))
+    _observer.observe(document.body, to_js({"childList": True}, dict_converter=Object.fromEntries))
+
+
+def _count(module: str, created: int = 0, destroyed: int = 0) -> None:
+    _created[module] = _created.get(module, 0) + created
+    _destroyed[module] = _destroyed.get(module, 0) + destroyed
+    _schedule_publish()
+
+
+def module_stats(module: str) -> dict:
+    created = _created.get(module, 0)
+    destroyed = _destroyed.get(module, 0)
+    return {"live": created - destroyed, "created": created, "destroyed": destroyed}
+
+
+def stats() -> dict:
+    modules = {module: module_stats(module) for module in sorted(_created)}
+    return {
+        "live": sum(module["live"] for module in modules.values()),
+        "scopes": len(_scopes),
+        "modules": modules,
+    }
+
+
+def _publish() -> None:
+    global _publish_pending
+    _publish_pending = False
+    try:
+        window.flexaryProxyStats = to_js(stats(), dict_converter=Object.fromEntries)
+    except Exception:
+        pass
+
+
+def _schedule_publish() -> None:
+    # One publish per turn of the event loop, however many proxies changed.
+    global _publish_pending
+    if _publish_pending:
+        return
+    _publish_pending = True
+    _call_soon(_publish)
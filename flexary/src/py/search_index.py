@@ -0,0 +1,276 @@
+"""Token/prefix inverted index over exercise records.
+
+Records are addressed by their position in the list the index was built from
+(the catalog's slots, which its facet bitmasks use too); add() and discard()
+fill and free single positions in place.  A query matches a
+record when every query token is a prefix of some token in one of the indexed
+fields; matches are ranked exact name, then name prefix, then name-token hits,
+then hits in the other fields, with ties kept in catalog order.
+
+A query token with no prefix match falls back to trigram similarity against
+the indexed vocabulary, so "lattisimus" still finds "latissimus".  Fuzzy
+matches rank after every exact one: name hits first, then hits in the other
+fields, each ordered by similarity, and hits well below the best one are
+dropped.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+
+import bitsets
+
+SEARCH_FIELDS = (
+    "name",
+    "category",
+    "body_parts",
+    "primary_muscles",
+    "secondary_muscles",
+    "equipment",
+    "key_cues",
+)
+
+RANK_EXACT_NAME = 0
+RANK_NAME_PREFIX = 1
+RANK_NAME_TOKENS = 2
+RANK_OTHER_FIELDS = 3
+# Fuzzy ranks are RANK_FUZZY (name hits) or RANK_FUZZY + 1 (other fields)
+# plus 1 - similarity, so they order by similarity within each group.
+RANK_FUZZY = 4
+
+FUZZY_THRESHOLD = 0.4
+# Fuzzy hits scoring more than this below the best one are left out.
+FUZZY_MARGIN = 0.15
+_FUZZY_MIN_TOKEN_LEN = 4
+_FUZZY_MAX_TOKENS = 8
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def trigrams(token: str) -> set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    def __init__(self, records: list[dict]) -> None:
+        postings: dict[str, list[int]] = {}
+        name_postings: dict[str, list[int]] = {}
+        self._names: list[str] = []
+
+        for position, record in enumerate(records):
+            name, name_tokens, tokens = self._record_tokens(record)
+            self._names.append(name)
+            for token in name_tokens:
+                name_postings.setdefault(token, []).append(position)
+            for token in tokens:
+                postings.setdefault(token, []).append(position)
+
+        # Postings are bitsets over record positions, the same layout as the
+        # catalog's facet masks, so matches combine with facets by AND.
+        size = len(records)
+        self._postings = {token: bitsets.from_positions(p, size) for token, p in postings.items()}
+        self._tokens = sorted(postings)
+        self._name_postings = {token: bitsets.from_positions(p, size) for token, p in name_postings.items()}
+        self._name_tokens = sorted(name_postings)
+
+        # Trigram -> vocabulary tokens containing it.  The vocabulary grows with
+        # distinct words, not with records, which bounds fuzzy candidate lookup.
+        self._trigram_tokens: dict[str, list[str]] = {}
+        self._trigram_counts: dict[str, int] = {}
+        for token in self._tokens:
+            self._add_trigrams(token)
+
+    @staticmethod
+    def _record_tokens(record: dict) -> tuple[str, set[str], set[str]]:
+        name = str(record.get("name", "")).lower()
+        tokens: set[str] = set()
+        for field in SEARCH_FIELDS:
+            tokens.update(tokenize(record.get(field, "")))
+        return name, set(tokenize(name)), tokens
+
+    def _add_trigrams(self, token: str) -> None:
+        grams = trigrams(token)
+        self._trigram_counts[token] = len(grams)
+        for gram in grams:
+            self._trigram_tokens.setdefault(gram, []).append(token)
+
+    def _remove_trigrams(self, token: str) -> None:
+        for gram in trigrams(token):
+            gram_tokens = self._trigram_tokens.get(gram, [])
+            if token in gram_tokens:
+                gram_tokens.remove(token)
+            if not gram_tokens:
+                self._trigram_tokens.pop(gram, None)
+        self._trigram_counts.pop(token, None)
+
+    def add(self, position: int, record: dict) -> None:
+        """Index record at position, a slot that is past the end or was discarded."""
+        name, name_tokens, tokens = self._record_tokens(record)
+        if position == len(self._names):
+            self._names.append(name)
+        else:
+            self._names[position] = name
+        bit = 1 << position
+        for postings, vocabulary, record_tokens, fuzzy in (
+            (self._postings, self._tokens, tokens, True),
+            (self._name_postings, self._name_tokens, name_tokens, False),
+        ):
+            for token in record_tokens:
+                if token not in postings:
+                    postings[token] = 0
+                    insort(vocabulary, token)
+                    if fuzzy:
+                        self._add_trigrams(token)
+                postings[token] |= bit
+
+    def discard(self, position: int, record: dict) -> None:
+        """Drop record, indexed at position, leaving the slot free for add()."""
+        _name, name_tokens, tokens = self._record_tokens(record)
+        self._names[position] = ""
+        bit = 1 << position
+        for postings, vocabulary, record_tokens, fuzzy in (
+            (self._postings, self._tokens, tokens, True),
+            (self._name_postings, self._name_tokens, name_tokens, False),
+        ):
+            for token in record_tokens:
+                mask = postings.get(token, 0) & ~bit
+                if mask:
+                    postings[token] = mask
+                    continue
+                postings.pop(token, None)
+                vocabulary.pop(bisect_left(vocabulary, token))
+                if fuzzy:
+                    self._remove_trigrams(token)
+
+    @staticmethod
+    def _prefix_matches(prefix: str, tokens: list[str], postings: dict[str, int]) -> int:
+        matches = 0
+        i = bisect_left(tokens, prefix)
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            matches |= postings[tokens[i]]
+            i += 1
+        return matches
+
+    def similar_tokens(self, token: str) -> list[str]:
+        """Vocabulary tokens whose trigram Jaccard similarity to token passes FUZZY_THRESHOLD.
+
+        Only tokens sharing at least one trigram are scored, and at most
+        _FUZZY_MAX_TOKENS of the best are returned.
+        """
+        return [candidate for _similarity, candidate in self._scored_similar_tokens(token)]
+
+    def _scored_similar_tokens(self, token: str) -> list[tuple[float, str]]:
+        if len(token) < _FUZZY_MIN_TOKEN_LEN:
+            return []
+        grams = trigrams(token)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._trigram_tokens.get(gram, ()))
+        scored = []
+        for candidate, common in shared.items():
+            similarity = common / (len(grams) + self._trigram_counts[candidate] - common)
+            if similarity >= FUZZY_THRESHOLD:
+                scored.append((similarity, candidate))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:_FUZZY_MAX_TOKENS]
+
+    def _match_all(self, query_tokens: list[str], tokens: list[str], postings: dict[str, int]) -> int:
+        matches = -1
+        for token in set(query_tokens):
+            matches &= self._prefix_matches(token, tokens, postings)
+            if not matches:
+                return 0
+        return max(matches, 0)
+
+    def search(self, query: str) -> dict[int, float]:
+        """Return {position: rank} for every record matching query, lower ranks first.
+
+        An empty query returns an empty dict; callers treat that as "no search".
+        """
+        query = query.strip().lower()
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return {}
+
+        matches = self._match_all(query_tokens, self._tokens, self._postings)
+        if not matches:
+            return self._search_fuzzy(query_tokens)
+        name_matches = set(bitsets.positions(self._match_all(query_tokens, self._name_tokens, self._name_postings)))
+
+        ranks: dict[int, int] = {}
+        for position in bitsets.positions(matches):
+            name = self._names[position]
+            if name == query:
+                ranks[position] = RANK_EXACT_NAME
+            elif name.startswith(query):
+                ranks[position] = RANK_NAME_PREFIX
+            elif position in name_matches:
+                ranks[position] = RANK_NAME_TOKENS
+            else:
+                ranks[position] = RANK_OTHER_FIELDS
+        return ranks
+
+    def _token_hits(self, token: str) -> list[tuple[float, int, int]]:
+        """(similarity, field matches, name matches) for a query token, best first.
+
+        A prefix match is one hit of similarity 1; otherwise every similar
+        vocabulary token is a hit.
+        """
+        matches = self._prefix_matches(token, self._tokens, self._postings)
+        if matches:
+            return [(1.0, matches, self._prefix_matches(token, self._name_tokens, self._name_postings))]
+        return [
+            (similarity, self._postings[candidate], self._name_postings.get(candidate, 0))
+            for similarity, candidate in self._scored_similar_tokens(token)
+        ]
+
+    def _search_fuzzy(self, query_tokens: list[str]) -> dict[int, float]:
+        hits_by_token = []
+        matches = -1
+        for token in set(query_tokens):
+            hits = self._token_hits(token)
+            token_matches = 0
+            for _similarity, field_matches, _name_matches in hits:
+                token_matches |= field_matches
+            matches &= token_matches
+            if not matches:
+                return {}
+            hits_by_token.append(hits)
+        matches = max(matches, 0)
+
+        # Per record: summed best similarity over the query tokens, in any
+        # field and in the name.  Hits are best first, so the first one wins.
+        field_scores: dict[int, float] = {}
+        name_scores: dict[int, float] = {}
+        name_tokens: dict[int, int] = {}
+        for hits in hits_by_token:
+            seen: set[int] = set()
+            seen_in_name: set[int] = set()
+            for similarity, field_matches, name_matches in hits:
+                for position in bitsets.positions(field_matches & matches):
+                    if position not in seen:
+                        seen.add(position)
+                        field_scores[position] = field_scores.get(position, 0.0) + similarity
+                for position in bitsets.positions(name_matches & matches):
+                    if position not in seen_in_name:
+                        seen_in_name.add(position)
+                        name_scores[position] = name_scores.get(position, 0.0) + similarity
+                        name_tokens[position] = name_tokens.get(position, 0) + 1
+
+        token_count = len(hits_by_token)
+        scores = {position: score / token_count for position, score in field_scores.items()}
+        cutoff = max(scores.values(), default=0.0) - FUZZY_MARGIN
+        ranks: dict[int, float] = {}
+        for position, score in scores.items():
+            if score < cutoff:
+                continue
+            if name_tokens.get(position) == token_count:
+                ranks[position] = RANK_FUZZY + 1 - name_scores[position] / token_count
+            else:
+                ranks[position] = RANK_FUZZY + 2 - score
+        return ranks
@@ -1,6 +1,8 @@
 import json
+from uuid import UUID
 
 import catalog
+import perf
 from js import localStorage, window
 from pyscript import document
 from pyweb import pydom
@@ -41,13 +43,41 @@ w_template = (
     else None
 )
 
-_raw = localStorage.getItem(ls_workouts_key)
-workouts: list[Workout] = workouts_from_json(_raw) if _raw else []
-active_workout = workouts[0].id if workouts else None
+# workouts, active_workout and custom_exercises are read from localStorage on
+# first access (see __getattr__ at the bottom), not when state is imported: the
+# saved plan can be large and the first paint does not need it.
+workouts: list[Workout]
+active_workout: UUID | None
+custom_exercises: list[dict]
+
+
+def _hydrate_workouts() -> list[Workout]:
+    global workouts, active_workout
+    if "workouts" not in globals():
+        with perf.span("state workouts"):
+            raw = localStorage.getItem(ls_workouts_key)
+            workouts = workouts_from_json(raw) if raw else []
+        if "active_workout" not in globals():
+            active_workout = workouts[0].id if workouts else None
+    return workouts
+
+
+def _hydrate_custom_exercises() -> list[dict]:
+    global custom_exercises
+    if "custom_exercises" not in globals():
+        custom_exercises = []
+        with perf.span("state custom exercises"):
+            raw = localStorage.getItem(ls_custom_exercises_key)
+            if raw:
+                try:
+                    custom_exercises = catalog.parse_custom_exercises(raw)
+                except Exception:
+                    pass
+    return custom_exercises
 
 
 def save_workouts() -> None:
-    localStorage.setItem(ls_workouts_key, workouts_to_json(workouts))
+    localStorage.setItem(ls_workouts_key, workouts_to_json(_hydrate_workouts()))
 
 
 def is_authenticated() -> bool:
@@ -64,16 +94,17 @@ def is_authenticated() -> bool:
     return bool(localStorage.getItem(ls_auth_session_key))
 
 
-def strip_custom_video_overrides() -> bool:
-    changed = False
-    for workout in workouts:
-        for exercise in workout.exercises:
-            if getattr(exercise, "custom_video_id", ""):
-                exercise.custom_video_id = ""
-                changed = True
-    if changed:
-        save_workouts()
-    return changed
+def visible_custom_video_id(exercise) -> str:
+    """The exercise's custom video, or "" while signed out.
+
+    Custom videos are a signed-in feature.  They are hidden when workouts are
+    shown or exported, but kept in the saved plan for the next sign-in.
+    """
+    return exercise.custom_video_id if exercise.custom_video_id and is_authenticated() else ""
+
+
+def has_custom_videos() -> bool:
+    return any(exercise.custom_video_id for workout in _hydrate_workouts() for exercise in workout.exercises)
 
 
 def flush_workout_inputs() -> None:
@@ -81,7 +112,7 @@ def flush_workout_inputs() -> None:
     before a download, bypassing change-event timing issues."""
     import datetime
     changed = False
-    for w in workouts:
+    for w in _hydrate_workouts():
         name_el = document.getElementById(f"workout-name-{w.id}")
         if name_el:
             val = str(name_el.value).strip()
@@ -104,15 +135,16 @@ active_category_filters: set[str] = set()
 active_body_part_filters: set[str] = set()
 active_primary_muscle_filters: set[str] = set()
 
-_filters_raw = localStorage.getItem(ls_filters_key)
-if _filters_raw:
-    try:
-        _f = json.loads(_filters_raw)
-        active_category_filters = set(c for c in _f.get("categories", []) if c is not None)
-        active_body_part_filters = set(c for c in _f.get("body_parts", []) if c is not None)
-        active_primary_muscle_filters = set(c for c in _f.get("primary_muscles", []) if c is not None)
-    except Exception:
-        pass
+with perf.span("state filters"):
+    _filters_raw = localStorage.getItem(ls_filters_key)
+    if _filters_raw:
+        try:
+            _f = json.loads(_filters_raw)
+            active_category_filters = set(c for c in _f.get("categories", []) if c is not None)
+            active_body_part_filters = set(c for c in _f.get("body_parts", []) if c is not None)
+            active_primary_muscle_filters = set(c for c in _f.get("primary_muscles", []) if c is not None)
+        except Exception:
+            pass
 
 data: list[dict] = []
 base_data: list[dict] = []
@@ -120,24 +152,22 @@ category_count: dict[str, int] = {}
 body_parts_list: list[str] = []
 primary_muscles_list: list[str] = []
 
-custom_exercises: list[dict] = []
-_custom_raw = localStorage.getItem(ls_custom_exercises_key)
-if _custom_raw:
-    try:
-        custom_exercises = catalog.parse_custom_exercises(_custom_raw)
-    except Exception:
-        pass
-
 
 def save_custom_exercises() -> None:
-    localStorage.setItem(ls_custom_exercises_key, json.dumps(custom_exercises))
+    localStorage.setItem(ls_custom_exercises_key, json.dumps(_hydrate_custom_exercises()))
 
 
 def next_custom_id() -> int:
-    if not custom_exercises:
+    customs = _hydrate_custom_exercises()
+    if not customs:
         return -1
-    return min(int(ex["id"]) for ex in custom_exercises) - 1
+    return min(int(ex["id"]) for ex in customs) - 1
 
 
-if workouts and not is_authenticated():
-    strip_custom_video_overrides()
+def __getattr__(name: str):
+    if name in ("workouts", "active_workout"):
+        _hydrate_workouts()
+        return globals()[name]
+    if name == "custom_exercises":
+        return _hydrate_custom_exercises()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
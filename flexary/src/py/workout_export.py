@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import io
 import json
@@ -7,12 +8,7 @@ from js import File, URL, Uint8Array, document, localStorage as _ls
 import catalog
 import state
 from common import yt_id_to_url
-
-
-def _split_csv(value: str) -> list:
-    if not value:
-        return []
-    return [v.strip() for v in value.split(",") if v.strip()]
+from exercise_records import list_field
 
 
 def _split_key_cues(value: str) -> list:
@@ -52,10 +48,11 @@ def _export_workout(workout) -> dict:
         ex_data = catalog.get_exercise(ex.id) or {}
         is_custom = ex_data.get("is_custom") == "true"
 
-        # Custom video takes priority; fall back to catalog default
+        # Custom video takes priority (signed in only); fall back to catalog default
+        custom_video_id = state.visible_custom_video_id(ex)
         video_url = (
-            yt_id_to_url(ex.custom_video_id)
-            if ex.custom_video_id
+            yt_id_to_url(custom_video_id)
+            if custom_video_id
             else yt_id_to_url(ex_data.get("yt_video_id", ""))
         )
 
@@ -71,9 +68,9 @@ def _export_workout(workout) -> dict:
             "rest_before_seconds": workout.breaks.get(ex.internal_id, 0),
             "superset_id": ex.superset_id,
             "video_url": video_url,
-            "category": _split_csv(ex_data.get("category", "")),
-            "equipment": _split_csv(ex_data.get("equipment", "")),
-            "instructions": ex_data.get("instructions", ""),
+            "category": list(list_field(ex_data, "category")),
+            "equipment": list(list_field(ex_data, "equipment")),
+            "instructions": catalog.exercise_detail(ex.id, "instructions"),
             "key_cues": _split_key_cues(ex_data.get("key_cues", "")),
             "is_custom": is_custom,
         })
@@ -98,6 +95,14 @@ def sync_export() -> None:
         _ls.removeItem("flexary_export")
         return
     _ls.setItem("flexary_export", json.dumps(_build_payload(), ensure_ascii=False))
+    if not catalog.details_loaded():
+        # Written without instructions for now; rewrite once they arrive.
+        asyncio.ensure_future(_sync_export_with_details())
+
+
+async def _sync_export_with_details() -> None:
+    if await catalog.fetch_details():
+        sync_export()
 
 
 def _build_payload() -> dict:
@@ -108,18 +113,20 @@ def _build_payload() -> dict:
     }
 
 
-def save_workouts(*args) -> None:
+async def save_workouts(*args) -> None:
     """Persist the current workouts to localStorage without downloading."""
     state.flush_workout_inputs()
     if not any(w.exercises for w in state.workouts):
         return
+    await catalog.fetch_details()
     _ls.setItem("flexary_export", json.dumps(_build_payload(), ensure_ascii=False))
 
 
-def download_workouts_json(*args) -> None:
+async def download_workouts_json(*args) -> None:
     state.flush_workout_inputs()
     if not any(w.exercises for w in state.workouts):
         return
+    await catalog.fetch_details()
 
     payload = _build_payload()
     _ls.setItem("flexary_export", json.dumps(payload, ensure_ascii=False))
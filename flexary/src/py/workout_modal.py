@@ -4,9 +4,9 @@ import json
 from uuid import uuid4
 
 from js import window
-from pyodide.ffi import create_proxy
 from pyscript import document
 
+import proxies
 import state
 from common import extract_yt_id, is_valid_yt_url, make_input_group, make_warning_el, show_warning, yt_id_to_url
 from i18n import t
@@ -27,7 +27,7 @@ def _inject_no_spinner_style():
         document.head.appendChild(style)
 
 
-def _make_sets_stepper(initial_value: int = 1):
+def _make_sets_stepper(owner, initial_value: int = 1):
     input_el = document.createElement("input")
     input_el.type = "hidden"
     input_el.value = str(initial_value)
@@ -73,8 +73,8 @@ def _make_sets_stepper(initial_value: int = 1):
         display.textContent = input_el.value
         input_el.dispatchEvent(window.Event.new("input", {"bubbles": True}))
 
-    minus_btn.addEventListener("click", create_proxy(_on_minus))
-    plus_btn.addEventListener("click", create_proxy(_on_plus))
+    owner.listen(minus_btn, "click", _on_minus)
+    owner.listen(plus_btn, "click", _on_plus)
 
     label = document.createElement("label")
     label.textContent = t("sets_label")
@@ -102,7 +102,7 @@ def _make_sets_stepper(initial_value: int = 1):
     return container, input_el
 
 
-def _make_rest_stepper(initial_value: int = 0):
+def _make_rest_stepper(owner, initial_value: int = 0):
     def _fmt(v):
         if v == 0:
             return "0"
@@ -156,8 +156,8 @@ def _make_rest_stepper(initial_value: int = 0):
         cur = int(input_el.value) if input_el.value.strip().isdigit() else 0
         _set_value(cur + 15)
 
-    minus_btn.addEventListener("click", create_proxy(_on_minus))
-    plus_btn.addEventListener("click", create_proxy(_on_plus))
+    owner.listen(minus_btn, "click", _on_minus)
+    owner.listen(plus_btn, "click", _on_plus)
 
     label = document.createElement("label")
     label.textContent = t("rest_label")
@@ -185,7 +185,7 @@ def _make_rest_stepper(initial_value: int = 0):
     return container, input_el, _set_value
 
 
-def _make_time_wheel(initial_value: str = ""):
+def _make_time_wheel(owner, initial_value: str = ""):
     h, m, s = 0, 0, 0
     if initial_value:
         parts_t = initial_value.split(":")
@@ -249,8 +249,8 @@ def _make_time_wheel(initial_value: str = ""):
             vals[i] = maxvals[i] if vals[i] <= 0 else vals[i] - 1
             disp.textContent = f"{vals[i]:02d}"
 
-        up.addEventListener("click", create_proxy(_up))
-        down.addEventListener("click", create_proxy(_down))
+        owner.listen(up, "click", _up)
+        owner.listen(down, "click", _down)
 
         col.appendChild(up)
         col.appendChild(disp)
@@ -301,7 +301,7 @@ def _make_time_wheel(initial_value: str = ""):
     return container, get_value
 
 
-def _make_reps_stepper(initial_value: str = ""):
+def _make_reps_stepper(owner, initial_value: str = ""):
     try:
         v = int(initial_value.strip()) if initial_value.strip().isdigit() else 0
     except ValueError:
@@ -345,8 +345,8 @@ def _make_reps_stepper(initial_value: str = ""):
         val[0] += 1
         display.textContent = str(val[0])
 
-    minus_btn.addEventListener("click", create_proxy(_on_minus))
-    plus_btn.addEventListener("click", create_proxy(_on_plus))
+    owner.listen(minus_btn, "click", _on_minus)
+    owner.listen(plus_btn, "click", _on_plus)
 
     lbl = document.createElement("label")
     lbl.textContent = t("reps_label")
@@ -377,7 +377,7 @@ def _make_reps_stepper(initial_value: str = ""):
     return container, get_value
 
 
-def _make_distance_stepper(initial_value: str = ""):
+def _make_distance_stepper(owner, initial_value: str = ""):
     unit = ["m"]
     val = [0]
     s = initial_value.strip().lower()
@@ -473,10 +473,10 @@ def _make_distance_stepper(initial_value: str = ""):
         except (ValueError, TypeError):
             pass
 
-    minus_btn.addEventListener("click", create_proxy(_on_minus))
-    plus_btn.addEventListener("click", create_proxy(_on_plus))
-    unit_btn.addEventListener("click", create_proxy(_on_unit_toggle))
-    display.addEventListener("input", create_proxy(_on_input))
+    owner.listen(minus_btn, "click", _on_minus)
+    owner.listen(plus_btn, "click", _on_plus)
+    owner.listen(unit_btn, "click", _on_unit_toggle)
+    owner.listen(display, "input", _on_input)
 
     lbl = document.createElement("label")
     lbl.textContent = t("distance_label")
@@ -508,7 +508,7 @@ def _make_distance_stepper(initial_value: str = ""):
     return container, get_value
 
 
-def _make_per_set_group(sets: int, reps_list=None, time_list=None, dist_list=None):
+def _make_per_set_group(owner, sets: int, reps_list=None, time_list=None, dist_list=None):
     reps_list = list(reps_list or [])
     time_list = list(time_list or [])
     dist_list = list(dist_list or [])
@@ -526,9 +526,9 @@ def _make_per_set_group(sets: int, reps_list=None, time_list=None, dist_list=Non
     set_panels = []
     all_inputs = []
     for i in range(sets):
-        reps_container, reps_get = _make_reps_stepper(reps_list[i])
-        time_container, time_get = _make_time_wheel(time_list[i])
-        dist_container, dist_get = _make_distance_stepper(dist_list[i])
+        reps_container, reps_get = _make_reps_stepper(owner, reps_list[i])
+        time_container, time_get = _make_time_wheel(owner, time_list[i])
+        dist_container, dist_get = _make_distance_stepper(owner, dist_list[i])
         all_inputs.append((reps_get, time_get, dist_get))
 
         def _divider():
@@ -621,8 +621,8 @@ def _make_per_set_group(sets: int, reps_list=None, time_list=None, dist_list=Non
         if current_set[0] < sets - 1:
             _show(current_set[0] + 1)
 
-    prev_btn.addEventListener("click", create_proxy(_on_prev))
-    next_btn.addEventListener("click", create_proxy(_on_next))
+    owner.listen(prev_btn, "click", _on_prev)
+    owner.listen(next_btn, "click", _on_next)
     _show(0)
 
     wrapper.appendChild(nav)
@@ -647,6 +647,7 @@ def _show_confirm_popup(anchor_el, message, on_confirm, confirm_label="Remove",
 
     overlay = document.createElement("div")
     overlay.className = "confirm-popup-overlay"
+    owner = proxies.scope("workout_modal:confirm", overlay)
 
     popup = document.createElement("div")
     popup.className = "confirm-popup"
@@ -680,9 +681,9 @@ def _show_confirm_popup(anchor_el, message, on_confirm, confirm_label="Remove",
         if evt.target == overlay:
             overlay.remove()
 
-    confirm_btn.addEventListener("click", create_proxy(_confirm))
-    cancel_btn.addEventListener("click", create_proxy(_cancel))
-    overlay.addEventListener("click", create_proxy(_dismiss))
+    owner.listen(confirm_btn, "click", _confirm)
+    owner.listen(cancel_btn, "click", _cancel)
+    owner.listen(overlay, "click", _dismiss)
 
     btn_row.appendChild(confirm_btn)
     btn_row.appendChild(cancel_btn)
@@ -716,6 +717,7 @@ def _show_break_popup(anchor_el, workout, ex_below, title=None) -> None:
 
     overlay = document.createElement("div")
     overlay.className = "break-popup-overlay confirm-popup-overlay"
+    owner = proxies.scope("workout_modal:break", overlay)
 
     popup = document.createElement("div")
     popup.className = "confirm-popup"
@@ -793,10 +795,10 @@ def _show_break_popup(anchor_el, workout, ex_below, title=None) -> None:
         if evt.target == overlay:
             overlay.remove()
 
-    save_btn.addEventListener("click", create_proxy(_save))
-    clear_btn.addEventListener("click", create_proxy(_clear))
-    cancel_btn.addEventListener("click", create_proxy(_cancel))
-    overlay.addEventListener("click", create_proxy(_dismiss))
+    owner.listen(save_btn, "click", _save)
+    owner.listen(clear_btn, "click", _clear)
+    owner.listen(cancel_btn, "click", _cancel)
+    owner.listen(overlay, "click", _dismiss)
 
     btn_row.appendChild(save_btn)
     btn_row.appendChild(clear_btn)
@@ -835,6 +837,7 @@ def _build_exercise_modal(
     """
     overlay = document.createElement("div")
     overlay.classList.add(overlay_class, "exercise-modal-overlay")
+    owner = proxies.scope("workout_modal:exercise", overlay)
     overlay.setAttribute("onclick", "event.stopPropagation()")
 
     modal = document.createElement("div")
@@ -845,8 +848,8 @@ def _build_exercise_modal(
     title.className = "exercise-modal-title"
     modal.appendChild(title)
 
-    sets_stepper, input_sets = _make_sets_stepper(initial_sets)
-    rest_group, input_rest, reset_rest = _make_rest_stepper(initial_rest)
+    sets_stepper, input_sets = _make_sets_stepper(owner, initial_sets)
+    rest_group, input_rest, reset_rest = _make_rest_stepper(owner, initial_rest)
     rest_group.style.display = "flex" if initial_sets > 1 else "none"
 
     input_notes = document.createElement("textarea")
@@ -864,7 +867,9 @@ def _build_exercise_modal(
         dist_list = [v.strip() for v in dist_csv.split(",") if v.strip()] if dist_csv else []
         while per_set_wrapper.firstChild:
             per_set_wrapper.removeChild(per_set_wrapper.firstChild)
-        group_el, get_vals = _make_per_set_group(n, reps_list, time_list, dist_list)
+        # Rebuilding replaces every per-set stepper, so they get their own scope.
+        group_owner = proxies.scope("workout_modal:per_set", overlay)
+        group_el, get_vals = _make_per_set_group(group_owner, n, reps_list, time_list, dist_list)
         per_set_wrapper.appendChild(group_el)
         get_per_set_values[0] = get_vals
 
@@ -895,8 +900,8 @@ def _build_exercise_modal(
             reps_csv, time_csv, dist_csv = get_per_set_values[0]() if get_per_set_values[0] else ("", "", "")
             _rebuild_per_set(int(val), reps_csv, time_csv, dist_csv)
 
-    input_sets.addEventListener("change", create_proxy(_on_sets_change))
-    input_sets.addEventListener("input", create_proxy(_on_sets_change))
+    owner.listen(input_sets, "change", _on_sets_change)
+    owner.listen(input_sets, "input", _on_sets_change)
 
     confirm_btn = document.createElement("button")
     confirm_btn.textContent = confirm_label
@@ -905,7 +910,7 @@ def _build_exercise_modal(
     cancel_btn = document.createElement("button")
     cancel_btn.textContent = t("cancel_btn")
     cancel_btn.className = "confirm-popup-confirm"
-    cancel_btn.onclick = lambda evt: overlay.remove()
+    owner.listen(cancel_btn, "click", lambda evt: overlay.remove())
 
     buttons_container = document.createElement("div")
     buttons_container.className = "exercise-modal-actions"
@@ -935,7 +940,7 @@ def _build_exercise_modal(
             on_confirm(sets, reps_val, time_val, distance_val, rest_val, notes_val, video_id)
         overlay.remove()
 
-    confirm_btn.onclick = _on_confirm
+    owner.listen(confirm_btn, "click", _on_confirm)
 
 
 def configure_exercise(exercise_id: str, exercise_name: str) -> None:
@@ -990,7 +995,9 @@ def edit_exercise_in_workout(event) -> None:
         target_ex.distance = distance_val
         target_ex.rest_between_sets = rest_val
         target_ex.notes = notes_val
-        target_ex.custom_video_id = video_id
+        # Signed out, the video field is hidden: keep the masked video as it was.
+        if state.is_authenticated():
+            target_ex.custom_video_id = video_id
         state.save_workouts()
         render_workouts(state.workouts)
 
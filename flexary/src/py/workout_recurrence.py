@@ -19,9 +19,9 @@ import copy
 import datetime
 from uuid import UUID, uuid4
 
-from pyodide.ffi import create_proxy
 from pyscript import document
 
+import proxies
 import state
 from i18n import t
 from models import Workout
@@ -314,6 +314,7 @@ def _show_recurrence_popup(workout):
     overlay = document.createElement("div")
     overlay.id = "recurrence-popup-overlay"
     overlay.className = "recurrence-overlay"
+    owner = proxies.scope("workout_recurrence:popup", overlay)
 
     modal = document.createElement("div")
     modal.className = "recurrence-modal"
@@ -342,7 +343,7 @@ def _show_recurrence_popup(workout):
     close_x.type = "button"
     close_x.className = "recurrence-modal-close"
     close_x.innerHTML = '<i class="bi bi-x-lg"></i>'
-    close_x.addEventListener("click", create_proxy(lambda evt: overlay.remove()))
+    owner.listen(close_x, "click", lambda evt: overlay.remove())
 
     header.appendChild(title_el)
     header.appendChild(close_x)
@@ -414,7 +415,7 @@ def _show_recurrence_popup(workout):
                     active_byday.add(code)
             return _toggle
 
-        btn.addEventListener("click", create_proxy(_make_toggle(btn, wd)))
+        owner.listen(btn, "click", _make_toggle(btn, wd))
         day_btns[wd] = btn
         pills_row.appendChild(btn)
 
@@ -531,7 +532,7 @@ def _show_recurrence_popup(workout):
         weekly_section.style.display = "flex" if f == "WEEKLY" else "none"
         monthly_section.style.display = "flex" if f == "MONTHLY" else "none"
 
-    freq_select.addEventListener("change", create_proxy(_on_freq_change))
+    owner.listen(freq_select, "change", _on_freq_change)
 
     def _on_end_change(evt):
         v = evt.target.value
@@ -539,7 +540,7 @@ def _show_recurrence_popup(workout):
         count_input.disabled = (v != "after")
 
     for r in [never_radio, on_radio, after_radio]:
-        r.addEventListener("change", create_proxy(_on_end_change))
+        owner.listen(r, "change", _on_end_change)
 
     # ── Footer: [clear (left)] [spacer] [Done] [Cancel] ──────────────────────
     footer = document.createElement("div")
@@ -555,7 +556,7 @@ def _show_recurrence_popup(workout):
             overlay.remove()
             clear_recurrence(_w)
 
-        clear_btn.addEventListener("click", create_proxy(_on_clear))
+        owner.listen(clear_btn, "click", _on_clear)
         footer.appendChild(clear_btn)
 
     spacer = document.createElement("div")
@@ -595,14 +596,14 @@ def _show_recurrence_popup(workout):
         overlay.remove()
         _apply_recurrence(_w, new_rec)
 
-    done_btn.addEventListener("click", create_proxy(_on_done))
+    owner.listen(done_btn, "click", _on_done)
     footer.appendChild(done_btn)
 
     cancel_btn = document.createElement("button")
     cancel_btn.type = "button"
     cancel_btn.className = "recurrence-btn--cancel"
     cancel_btn.textContent = t("cancel_btn")
-    cancel_btn.addEventListener("click", create_proxy(lambda evt: overlay.remove()))
+    owner.listen(cancel_btn, "click", lambda evt: overlay.remove())
     footer.appendChild(cancel_btn)
 
     modal.appendChild(footer)
@@ -613,7 +614,7 @@ def _show_recurrence_popup(workout):
         if evt.target == overlay:
             overlay.remove()
 
-    overlay.addEventListener("click", create_proxy(_on_overlay_click))
+    owner.listen(overlay, "click", _on_overlay_click)
 
 
 def open_recurrence_popup(event):
@@ -2,10 +2,10 @@ import asyncio
 import datetime
 from uuid import UUID
 
-from pyodide.ffi import create_proxy
 from pyscript import document
 from pyweb import pydom
 
+import proxies
 import state
 from i18n import t
 from workout_domain import _can_move, _event_attr, toggle_superset
@@ -14,6 +14,11 @@ from workout_persistence import remove_workout
 from workout_recurrence import open_recurrence_popup, recurrence_summary
 
 
+# Proxies for the handlers of the current render; render_workouts() opens a new
+# scope, which destroys the previous render's proxies.
+_render_scope = proxies.scope("workout_rendering")
+
+
 def workout_edit(event) -> None:
     workout_id = _event_attr(event, "data-workout-id")
     if not workout_id:
@@ -49,7 +54,7 @@ def _make_superset_connector(workout, idx_above, idx_below):
 
     el.appendChild(icon)
     el.appendChild(lbl)
-    el.addEventListener("click", create_proxy(toggle_superset))
+    _render_scope.listen(el, "click", toggle_superset)
 
     if not is_linked:
         id_above = ex_above.internal_id
@@ -65,8 +70,8 @@ def _make_superset_connector(workout, idx_above, idx_below):
             for node in document.querySelectorAll(".superset-hover-stay"):
                 node.classList.remove("superset-hover-stay")
 
-        el.addEventListener("mouseenter", create_proxy(_on_mouseenter))
-        el.addEventListener("mouseleave", create_proxy(_on_mouseleave))
+        _render_scope.listen(el, "mouseenter", _on_mouseenter)
+        _render_scope.listen(el, "mouseleave", _on_mouseleave)
 
     return el
 
@@ -106,13 +111,16 @@ def _make_break_row(workout, ex_below, popup_title=None):
             _show_break_popup(row, w, ex_b, title=pt)
         return _on_click
 
-    row.addEventListener("click", create_proxy(_make_break_handler(workout, ex_below, popup_title)))
+    _render_scope.listen(row, "click", _make_break_handler(workout, ex_below, popup_title))
     return row
 
 
 def render_workouts(workouts: list) -> None:
+    global _render_scope
     from workout_modal import edit_exercise_in_workout, remove_exercise_from_workout
 
+    _render_scope = proxies.scope("workout_rendering")
+
     ws_container = pydom["#workout-list-container"][0]
     while ws_container._js.firstChild:
         ws_container._js.removeChild(ws_container._js.firstChild)
@@ -129,12 +137,12 @@ def render_workouts(workouts: list) -> None:
             workout_layover._js.classList.add("d-none")
 
         workout_edit_btn = workout_layover.find("#workout-edit")[0]
-        workout_edit_btn._js.onclick = workout_edit
+        _render_scope.listen(workout_edit_btn._js, "click", workout_edit)
         workout_edit_btn._js.setAttribute("data-workout-id", str(w.id))
         workout_edit_btn._js.removeAttribute("id")
 
         workout_edit_btn_icon = workout_layover.find("#workout-edit-icon")[0]
-        workout_edit_btn_icon._js.onclick = workout_edit
+        _render_scope.listen(workout_edit_btn_icon._js, "click", workout_edit)
         workout_edit_btn_icon._js.setAttribute("data-workout-id", str(w.id))
         workout_edit_btn_icon._js.removeAttribute("id")
 
@@ -154,7 +162,7 @@ def render_workouts(workouts: list) -> None:
                     break
             state.save_workouts()
 
-        w_name._js.addEventListener("change", create_proxy(on_name_change))
+        _render_scope.listen(w_name._js, "change", on_name_change)
 
         w_date = w_div.find("#workout-date")[0]
         w_date._js.value = w.execution_date.strftime("%Y-%m-%d")
@@ -175,15 +183,15 @@ def render_workouts(workouts: list) -> None:
                     break
             state.save_workouts()
 
-        w_date._js.addEventListener("change", create_proxy(on_date_change))
+        _render_scope.listen(w_date._js, "change", on_date_change)
 
         w_remove_btn = w_div.find("#workout-remove")[0]
-        w_remove_btn._js.onclick = remove_workout
+        _render_scope.listen(w_remove_btn._js, "click", remove_workout)
         w_remove_btn._js.setAttribute("data-workout-id", str(w.id))
         w_remove_btn._js.removeAttribute("id")
 
         w_remove_icon = w_div.find("#workout-remove-icon")[0]
-        w_remove_icon._js.onclick = remove_workout
+        _render_scope.listen(w_remove_icon._js, "click", remove_workout)
         w_remove_icon._js.setAttribute("data-workout-id", str(w.id))
         w_remove_icon._js.removeAttribute("id")
 
@@ -223,9 +231,10 @@ def render_workouts(workouts: list) -> None:
                 notes_el.className = "exercise-item-notes"
                 notes_el.textContent = exercise.notes[:60] + "…" if len(exercise.notes) > 60 else exercise.notes
                 item_name_span.appendChild(notes_el)
-            if state.is_authenticated() and exercise.custom_video_id:
+            custom_video_id = state.visible_custom_video_id(exercise)
+            if custom_video_id:
                 video_link_el = document.createElement("a")
-                video_link_el.href = f"https://www.youtube.com/watch?v={exercise.custom_video_id}"
+                video_link_el.href = f"https://www.youtube.com/watch?v={custom_video_id}"
                 video_link_el.target = "_blank"
                 video_link_el.rel = "noopener noreferrer"
                 video_link_el.className = "exercise-item-video-link"
@@ -237,7 +246,7 @@ def render_workouts(workouts: list) -> None:
 
             w_item_move_up = w_li.find("#workout-item-move-up")[0]
             from workout_domain import move_exercise_up, move_exercise_down
-            w_item_move_up._js.onclick = move_exercise_up
+            _render_scope.listen(w_item_move_up._js, "click", move_exercise_up)
             w_item_move_up._js.setAttribute("data-workout-exercise-id", exercise.internal_id)
             w_item_move_up._js.setAttribute("data-workout-id", str(w.id))
             if not _can_move(w.exercises, ei, -1):
@@ -246,7 +255,7 @@ def render_workouts(workouts: list) -> None:
                 w_item_move_up._js.classList.remove("disabled")
 
             w_item_move_down = w_li.find("#workout-item-move-down")[0]
-            w_item_move_down._js.onclick = move_exercise_down
+            _render_scope.listen(w_item_move_down._js, "click", move_exercise_down)
             w_item_move_down._js.setAttribute("data-workout-exercise-id", exercise.internal_id)
             w_item_move_down._js.setAttribute("data-workout-id", str(w.id))
             if not _can_move(w.exercises, ei, +1):
@@ -255,13 +264,13 @@ def render_workouts(workouts: list) -> None:
                 w_item_move_down._js.classList.remove("disabled")
 
             w_item_edit_icon = w_li.find("#workout-item-edit")[0]
-            w_item_edit_icon._js.onclick = edit_exercise_in_workout
+            _render_scope.listen(w_item_edit_icon._js, "click", edit_exercise_in_workout)
             w_item_edit_icon._js.setAttribute("data-exercise-id", str(exercise.id))
             w_item_edit_icon._js.setAttribute("data-workout-exercise-id", exercise.internal_id)
             w_item_edit_icon._js.setAttribute("data-workout-id", str(w.id))
 
             w_item_remove_icon = w_li.find("#workout-item-remove")[0]
-            w_item_remove_icon._js.onclick = remove_exercise_from_workout
+            _render_scope.listen(w_item_remove_icon._js, "click", remove_exercise_from_workout)
             w_item_remove_icon._js.setAttribute("data-exercise-id", str(exercise.id))
             w_item_remove_icon._js.setAttribute("data-workout-exercise-id", exercise.internal_id)
             w_item_remove_icon._js.setAttribute("data-workout-id", str(w.id))
@@ -357,8 +366,8 @@ def render_workouts(workouts: list) -> None:
                         return _on_minus, _on_plus
 
                     _on_minus, _on_plus = _make_rounds_handlers(w, sid, rounds_input, rounds_display)
-                    minus_btn.addEventListener("click", create_proxy(_on_minus))
-                    plus_btn.addEventListener("click", create_proxy(_on_plus))
+                    _render_scope.listen(minus_btn, "click", _on_minus)
+                    _render_scope.listen(plus_btn, "click", _on_plus)
                 else:
                     current_superset_wrapper.appendChild(_make_superset_connector(w, ei - 1, ei))
 
@@ -405,7 +414,7 @@ def render_workouts(workouts: list) -> None:
         w_repeat_btn = w_div.find("#workout-repeat")[0]
         w_repeat_btn._js.setAttribute("data-workout-id", str(w.id))
         w_repeat_btn._js.removeAttribute("id")
-        w_repeat_btn._js.addEventListener("click", create_proxy(open_recurrence_popup))
+        _render_scope.listen(w_repeat_btn._js, "click", open_recurrence_popup)
 
         # Open-workout link (authenticated only)
         open_btn = w_div.find("#workout-open-btn")[0]
@@ -0,0 +1,158 @@
+/**
+ * Offline-first service worker.
+ *
+ * scripts/build_sw_manifest.py writes sw-manifest.json (every app file with
+ * its content hash) and stamps the manifest version into VERSION below, so
+ * any change to the app ships a byte-different worker and triggers an update.
+ *
+ * - App files are precached into flexary-app-<VERSION>.  Files whose hash is
+ *   unchanged are copied from the previous version's cache; the rest are
+ *   downloaded.  If any download fails the install fails and the previous
+ *   version keeps serving, so a page never mixes files from two versions.
+ * - The new version only takes over once no page runs the old one (no
+ *   skipWaiting), then deletes the old caches.
+ * - The pinned runtime (PyScript, Pyodide, bootstrap-icons) and the wheels
+ *   micropip installs for the PDF stack go into flexary-runtime-<runtime
+ *   version>, which survives app updates.
+ * - Both are served cache-first; everything else goes to the network.
+ */
+
+const VERSION = "b784a34421e8";
+const APP_CACHE = `flexary-app-${VERSION}`;
+const MANIFEST_URL = new URL("./sw-manifest.json", self.registration.scope).href;
+const INDEX_URL = new URL("./index.html", self.registration.scope).href;
+
+// Cross-origin URLs served from the runtime cache: the pinned runtime, plus
+// the package index and wheels micropip fetches for the pinned PDF packages.
+const RUNTIME_PREFIXES = [
+  "https://pyscript.net/releases/2024.1.1/",
+  "https://cdn.jsdelivr.net/pyodide/v0.24.1/",
+  "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/",
+  "https://pypi.org/pypi/",
+  "https://files.pythonhosted.org/packages/",
+];
+
+let manifestPromise = null;
+
+function loadManifest() {
+  // The manifest this worker was installed with.
+  if (!manifestPromise) {
+    manifestPromise = caches
+      .open(APP_CACHE)
+      .then((cache) => cache.match(MANIFEST_URL))
+      .then((response) => (response ? response.json() : null));
+  }
+  return manifestPromise;
+}
+
+async function previousVersion() {
+  for (const name of await caches.keys()) {
+    if (!name.startsWith("flexary-app-") || name === APP_CACHE) continue;
+    const cache = await caches.open(name);
+    const response = await cache.match(MANIFEST_URL);
+    if (response) return { cache, manifest: await response.json() };
+  }
+  return null;
+}
+
+async function precacheApp(manifest) {
+  const previous = await previousVersion();
+  const cache = await caches.open(APP_CACHE);
+  await Promise.all(
+    Object.entries(manifest.files).map(async ([path, hash]) => {
+      const url = new URL(path, self.registration.scope).href;
+      let response = null;
+      if (previous && previous.manifest.files[path] === hash) {
+        response = await previous.cache.match(url);
+      }
+      if (!response) {
+        response = await fetch(url, { cache: "reload" });
+        if (!response.ok) throw new Error(`precache ${path}: ${response.status}`);
+      }
+      await cache.put(url, response);
+    }),
+  );
+  // Written last: a cache holding the manifest is complete.
+  await cache.put(MANIFEST_URL, new Response(JSON.stringify(manifest)));
+}
+
+async function precacheRuntime(runtime) {
+  // Best effort: whatever is missed here is cached on first use instead.
+  const cache = await caches.open(`flexary-runtime-${runtime.version}`);
+  await Promise.all(
+    runtime.precache.map(async (url) => {
+      if (await cache.match(url)) return;
+      try {
+        const response = await fetch(url);
+        if (response.ok) await cache.put(url, response);
+      } catch {
+        // Offline or blocked: leave it to the fetch handler.
+      }
+    }),
+  );
+}
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    (async () => {
+      const response = await fetch(MANIFEST_URL, { cache: "no-store" });
+      if (!response.ok) throw new Error(`manifest: ${response.status}`);
+      const manifest = await response.json();
+      if (manifest.version !== VERSION) throw new Error(`manifest ${manifest.version} is not ${VERSION}`);
+      try {
+        await precacheApp(manifest);
+      } catch (err) {
+        await caches.delete(APP_CACHE);
+        throw err;
+      }
+      await precacheRuntime(manifest.runtime);
+    })(),
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    (async () => {
+      const manifest = await loadManifest();
+      const keep = new Set([APP_CACHE, `flexary-runtime-${manifest.runtime.version}`]);
+      for (const name of await caches.keys()) {
+        if (name.startsWith("flexary-") && !keep.has(name)) await caches.delete(name);
+      }
+      await self.clients.claim();
+    })(),
+  );
+});
+
+async function fromAppCache(request) {
+  const cache = await caches.open(APP_CACHE);
+  if (request.mode !== "navigate") return cache.match(request);
+  // Pages are cached once, whatever their query string (detail.html?exercise_id=…).
+  const url = new URL(request.url);
+  url.search = "";
+  return cache.match(url.href === self.registration.scope ? INDEX_URL : url.href);
+}
+
+async function fromRuntimeCache(request, runtime) {
+  const cache = await caches.open(`flexary-runtime-${runtime.version}`);
+  const cached = await cache.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  // Opaque: a no-cors <link> stylesheet, which cannot be inspected but replays fine.
+  if (response.ok || response.type === "opaque") await cache.put(request, response.clone());
+  return response;
+}
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") return;
+  const app = request.url.startsWith(self.registration.scope);
+  if (!app && !RUNTIME_PREFIXES.some((prefix) => request.url.startsWith(prefix))) return;
+  event.respondWith(
+    (async () => {
+      const manifest = await loadManifest();
+      if (!manifest) return fetch(request);
+      if (app) return (await fromAppCache(request)) || fetch(request);
+      return fromRuntimeCache(request, manifest.runtime);
+    })(),
+  );
+});
@@ -1,4 +1,6 @@
 import { expect, test } from '@playwright/test';
+import { createHash } from 'node:crypto';
+import { readFileSync } from 'node:fs';
 
 async function waitForLibrary(page) {
   await page.goto('/index.html');
@@ -34,6 +36,32 @@ test.describe('Flexary UI', () => {
     await expect(page.locator('#exercises-row')).toContainText('Goblet Squat');
   });
 
+  test('search matches word prefixes and ranks name matches first', async ({ page }) => {
+    await waitForLibrary(page);
+
+    const cards = page.locator('#exercises-row [data-exercise-id]');
+    await page.locator('#search-input').fill('squ');
+    await expect(page.locator('#exercises-row')).toContainText('Body Weight Squat');
+    await expect(page.locator('#exercises-row')).toContainText('Goblet Squat');
+
+    await page.locator('#search-input').fill('goblet sq');
+    await expect(cards).toHaveCount(1);
+    await expect(cards.first()).toHaveAttribute('data-exercise-name', 'Goblet Squat');
+
+    // "push" also appears in other exercises' key cues; the name match leads.
+    await page.locator('#search-input').fill('push');
+    await expect(cards.first()).toHaveAttribute('data-exercise-name', 'Push-Ups');
+    expect(await cards.count()).toBeGreaterThan(1);
+  });
+
+  test('misspelled search puts the closest name match first', async ({ page }) => {
+    await waitForLibrary(page);
+
+    await page.locator('#search-input').fill('pushup');
+    const cards = page.locator('#exercises-row [data-exercise-id]');
+    await expect(cards.first()).toHaveAttribute('data-exercise-name', 'Push-Ups');
+  });
+
   test('language switch reloads translated UI', async ({ page }) => {
     await waitForLibrary(page);
 
@@ -127,6 +155,69 @@ test.describe('Flexary UI', () => {
     await expect(page.locator(`#exercises-row [data-exercise-name="${customName}"]`)).toBeVisible();
   });
 
+  test('detail page marks alternatives that are not in the library', async ({ page }) => {
+    await page.evaluate(() => {
+      localStorage.setItem('flexary_custom_exercises', JSON.stringify([
+        {
+          id: '-1',
+          name: 'Playwright Alternatives Source',
+          category: 'Strength',
+          body_parts: 'Arms',
+          alternatives: '1,-99',
+          is_custom: 'true',
+        },
+      ]));
+    });
+    await page.goto('/detail.html?exercise_id=-1');
+
+    await expect(page.locator('#container')).toBeVisible();
+    await expect(page.locator('#alt-ex-container')).toContainText('Body Weight Squat');
+    await expect(page.locator('#alt-ex-container')).toContainText('Missing exercise (ID -99)');
+  });
+
+  test('unknown alternative ids warn but do not block saving', async ({ page }) => {
+    await waitForLibrary(page);
+
+    const customName = 'Playwright Unknown Alternatives';
+
+    await page.locator('#add-custom-exercise').click();
+    const modal = page.locator('.cm-overlay');
+    await modal.getByPlaceholder('e.g. Resistance Band Row').fill(customName);
+    await modal.locator('select').selectOption('Strength');
+    await modal.getByPlaceholder('e.g. Legs, Core').fill('Back');
+    await modal.getByRole('button', { name: 'Next →' }).click();
+
+    await modal.getByPlaceholder('Comma-separated exercise IDs').fill('1, 424242');
+    await expect(modal).toContainText('Not in the library: 424242');
+    await modal.getByRole('button', { name: 'Add' }).click();
+
+    await expect(page.locator(`#exercises-row [data-exercise-name="${customName}"]`)).toBeVisible();
+    const stored = await page.evaluate(() => localStorage.getItem('flexary_custom_exercises'));
+    expect(stored).toContain('424242');
+  });
+
+  test('editing a custom exercise updates its card and search in place', async ({ page }) => {
+    await page.evaluate(() => {
+      localStorage.setItem('flexary_custom_exercises', JSON.stringify([
+        { id: '-1', name: 'Playwright Before Edit', category: 'Strength', body_parts: 'Arms', is_custom: 'true' },
+      ]));
+    });
+    await waitForLibrary(page);
+
+    const card = page.locator('#exercises-row [data-exercise-name="Playwright Before Edit"]');
+    await card.locator('.bi-pencil').click();
+    const modal = page.locator('.cm-overlay');
+    await modal.getByPlaceholder('e.g. Resistance Band Row').fill('Playwright After Edit');
+    await modal.getByRole('button', { name: 'Next →' }).click();
+    await modal.getByRole('button', { name: 'Save' }).click();
+
+    await expect(page.locator('#exercises-row [data-exercise-name="Playwright Before Edit"]')).toHaveCount(0);
+    await page.locator('#search-input').fill('playwright after');
+    const cards = page.locator('#exercises-row [data-exercise-id]');
+    await expect(cards).toHaveCount(1);
+    await expect(cards.first()).toHaveAttribute('data-exercise-name', 'Playwright After Edit');
+  });
+
   test('guests do not see stored custom workout video traces', async ({ page }) => {
     await page.evaluate(() => {
       localStorage.setItem('workouts', JSON.stringify([
@@ -240,3 +331,28 @@ test.describe('Stretching category', () => {
     await expect(customCard.locator('#category-badge')).toHaveClass(/bg-primary/);
   });
 });
+
+test.describe('Build artifacts', () => {
+  // The browser trusts these files without hashing the CSV, so a stale one
+  // would ship the old catalog silently (see scripts/build_catalog_snapshot.py).
+  for (const file of ['data/exercises_snapshot.json', 'data/exercise_details.json']) {
+    test(`${file} was built from the current CSV`, () => {
+      const csvHash = createHash('sha256').update(readFileSync('data/exercises_library.csv')).digest('hex');
+      const built = JSON.parse(readFileSync(file, 'utf-8'));
+      expect(built.source_sha256, 'run python scripts/build_catalog_snapshot.py').toBe(csvHash);
+    });
+  }
+
+  // sw.js refuses to install when the committed manifest does not match its
+  // VERSION, and serves whatever the manifest hashed until the next version.
+  test('sw-manifest.json and sw.js match the served files', () => {
+    const manifest = JSON.parse(readFileSync('sw-manifest.json', 'utf-8'));
+    expect(readFileSync('sw.js', 'utf-8'), 'run python scripts/build_sw_manifest.py').toContain(
+      `const VERSION = "${manifest.version}";`,
+    );
+    for (const [file, hash] of Object.entries(manifest.files)) {
+      const actual = createHash('sha256').update(readFileSync(file)).digest('hex');
+      expect(actual, `${file} changed: run python scripts/build_sw_manifest.py`).toBe(hash);
+    }
+  });
+});